@@ -30,6 +30,9 @@ def is_rate_limited(
 ) -> bool:
     """Check if a request exceeds rate limit.
 
+    Uses a fixed window that starts at the first attempt. Every call counts
+    as an attempt, including ones that are rejected.
+
     Args:
         request: HTTP request object
         action: Action identifier (e.g., 'comment_add', 'user_signup')
@@ -40,14 +43,27 @@ def is_rate_limited(
         True if rate limited, False otherwise
     """
     key = get_identifier_for_user_action(request, action)
-    attempt_count = cache.get(key, 0)
 
-    if attempt_count >= max_attempts:
-        return True
+    return _record_attempt(key, window_seconds) > max_attempts
+
 
-    # Increment counter and set expiration
-    cache.set(key, attempt_count + 1, window_seconds)
-    return False
+def _record_attempt(key: str, window_seconds: int) -> int:
+    """Atomically count one attempt and return the running total.
+
+    Inside a window this is a single incr() round-trip. Only the first
+    attempt also pays for add(), which starts the window. If a concurrent
+    request creates the counter first, add() fails and the loop goes back
+    to incr().
+
+    A backend configured to swallow connection errors returns None from
+    incr(); that counts as zero so an unreachable cache fails open.
+    """
+    while True:
+        try:
+            return cache.incr(key) or 0
+        except ValueError:
+            if cache.add(key, 1, window_seconds):
+                return 1
 
 
 def get_rate_limit_info(request: HttpRequest, action: str, max_attempts: int) -> dict:
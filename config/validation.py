@@ -1,6 +1,7 @@
 """Input validation and sanitization utilities."""
 
 import re
+from collections.abc import Iterator
 
 # Safe HTML tags for rich text comments
 SAFE_TAGS = {
@@ -29,6 +30,19 @@ MAX_COMMENT_LENGTH = 5000
 MAX_USERNAME_LENGTH = 150
 MAX_EMAIL_LENGTH = 254
 
+# Patterns for sanitize_html, compiled once. They must run in the order
+# sanitize_html applies them: each pass can join up text the next one matches.
+_SCRIPT_RE = re.compile(r"<script[^>]*>.*?</script>", flags=re.DOTALL | re.IGNORECASE)
+_EVENT_HANDLER_RE = re.compile(
+    r'\s+on\w+\s*=\s*["\']?[^"\'>\s]+["\']?',
+    flags=re.IGNORECASE,
+)
+_IFRAME_RE = re.compile(r"<iframe[^>]*>.*?</iframe>", flags=re.DOTALL | re.IGNORECASE)
+_STYLE_RE = re.compile(r"<style[^>]*>.*?</style>", flags=re.DOTALL | re.IGNORECASE)
+# Letters, digits, underscore and hyphen. ``\w`` is str.isalnum() plus "_",
+# so Unicode letters are accepted exactly as before.
+_USERNAME_RE = re.compile(r"[\w-]+")
+
 
 def sanitize_html(html_content: str) -> str:
     """Sanitize HTML to prevent XSS attacks by removing dangerous tags.
@@ -42,37 +56,50 @@ def sanitize_html(html_content: str) -> str:
     if not isinstance(html_content, str):
         return ""
 
+    # No markup at all: there is no element or attribute to strip
+    if "<" not in html_content:
+        return html_content
+
     # Remove script tags and content
-    sanitized = re.sub(
-        r"<script[^>]*>.*?</script>",
-        "",
-        html_content,
-        flags=re.DOTALL | re.IGNORECASE,
-    )
+    sanitized = _SCRIPT_RE.sub("", html_content)
 
     # Remove event handlers
-    sanitized = re.sub(
-        r'\s+on\w+\s*=\s*["\']?[^"\'>\s]+["\']?',
-        "",
-        sanitized,
-        flags=re.IGNORECASE,
-    )
+    sanitized = _EVENT_HANDLER_RE.sub("", sanitized)
 
     # Remove iframe tags
-    sanitized = re.sub(
-        r"<iframe[^>]*>.*?</iframe>",
-        "",
-        sanitized,
-        flags=re.DOTALL | re.IGNORECASE,
-    )
+    sanitized = _IFRAME_RE.sub("", sanitized)
 
     # Remove style tags
-    return re.sub(
-        r"<style[^>]*>.*?</style>",
-        "",
-        sanitized,
-        flags=re.DOTALL | re.IGNORECASE,
-    )
+    return _STYLE_RE.sub("", sanitized)
+
+
+def _visible_length(html: str, limit: int) -> int:
+    """Count the characters left once ``<...>`` tags are removed.
+
+    Matches ``re.sub(r"<[^>]+>", "", html)`` without building the stripped
+    string: an empty ``<>`` and a ``<`` with no closing ``>`` both count as
+    text. Scanning stops as soon as the count passes ``limit``, so the result
+    is exact only up to ``limit`` and otherwise merely greater than it.
+    """
+    length = 0
+    pos = 0
+    while True:
+        # Only look for the next tag as far as the remaining budget reaches:
+        # if none starts before then, that stretch of text alone is too long.
+        stop = pos + limit - length + 1
+        lt = html.find("<", pos, stop)
+        if lt < 0:
+            return length + min(len(html), stop) - pos
+        gt = html.find(">", lt + 1)
+        if gt < 0:
+            return length + len(html) - pos
+        if gt == lt + 1:
+            # "<>" is not a tag: keep the "<" as text and rescan from the ">".
+            length += gt - pos
+            pos = gt
+        else:
+            length += lt - pos
+            pos = gt + 1
 
 
 def validate_comment_length(text_blocks: list) -> tuple[bool, str]:
@@ -93,11 +120,16 @@ def validate_comment_length(text_blocks: list) -> tuple[bool, str]:
             value = block["value"]
             # For rich_text blocks, strip HTML tags for length calculation
             if block.get("type") == "rich_text" and isinstance(value, str):
-                clean_text = re.sub(r"<[^>]+>", "", value)
-                total_length += len(clean_text)
+                total_length += _visible_length(
+                    value,
+                    MAX_COMMENT_LENGTH - total_length,
+                )
             # For code blocks, use the content directly
             elif block.get("type") == "code" and isinstance(value, dict):
                 total_length += len(value.get("content") or value.get("code", ""))
+            # Already too long; the remaining blocks cannot change the answer
+            if total_length > MAX_COMMENT_LENGTH:
+                break
 
     if total_length == 0:
         return False, "Comment cannot be empty"
@@ -135,7 +167,7 @@ def validate_username(username: str) -> tuple[bool, str]:
         return False, "Username must be at least 3 characters"
 
     # Only allow alphanumeric, underscore, hyphen
-    if not all(c.isalnum() or c in "_-" for c in username):
+    if not _USERNAME_RE.fullmatch(username):
         return (
             False,
             "Username can only contain letters, numbers, underscore, and hyphen",
@@ -154,92 +186,123 @@ def validate_email(email: str) -> tuple[bool, str]:
         Tuple of (is_valid, error_message)
     """
     # Type and basic presence check
-    if not isinstance(email, str) or not email.strip():
+    if not isinstance(email, str):
+        return False, "Email must be a non-empty string"
+
+    # strip() hands back the same object when there is nothing to trim
+    email = email.strip()
+    if not email:
         return False, "Email must be a non-empty string"
 
-    email = email.strip().lower()
+    # Case only matters here when lowering changes the length, which
+    # ASCII never does, so skip the copy for plain ASCII addresses.
+    if not email.isascii():
+        email = email.lower()
 
     if len(email) > MAX_EMAIL_LENGTH:
         return False, f"Email exceeds maximum length of {MAX_EMAIL_LENGTH}"
 
-    # Prevent domain spoofing - check for exactly one @
-    if email.count("@") != 1:
+    # Prevent domain spoofing - check for exactly one @. Working with its
+    # index avoids splitting the address into new strings.
+    at = email.find("@")
+    if at < 0 or at != email.rfind("@"):
         return False, "Invalid email format"
 
-    local, domain = email.rsplit("@", 1)
-
     # Validate both parts exist and local part is not too long (RFC 5321)
-    if not local or not domain or len(local) > 64 or "." not in domain:
+    if not 0 < at <= 64 or email.find(".", at + 1) < 0:
         return False, "Invalid email format"
 
     return True, ""
 
 
-def sanitize_streamfield_blocks(blocks: list) -> tuple[list, list]:
-    """Sanitize StreamField blocks for XSS attacks.
+def _sanitize_rich_text(i: int, value) -> tuple[dict | None, str | None]:
+    if not isinstance(value, str):
+        return None, f"Block {i} rich_text value must be string"
+    return {"type": "rich_text", "value": sanitize_html(value)}, None
+
+
+def _sanitize_code(i: int, value) -> tuple[dict | None, str | None]:
+    if not isinstance(value, dict):
+        return None, f"Block {i} code value must be dict"
+
+    content = value.get("content") or value.get("code", "")
+    language = value.get("language", "")
+
+    # Validate content is string and not too long
+    if not isinstance(content, str):
+        return None, f"Block {i} code content must be string"
+
+    if len(content) > 10000:  # Max code block size
+        return None, f"Block {i} code content exceeds 10000 characters"
+
+    return (
+        {
+            "type": "code",
+            "value": {
+                "code": content,
+                "content": content,
+                "language": language if isinstance(language, str) else "",
+            },
+        },
+        None,
+    )
+
+
+# Sanitizer for each StreamField block type a comment may contain
+_BLOCK_SANITIZERS = {
+    "rich_text": _sanitize_rich_text,
+    "code": _sanitize_code,
+}
+
+
+def iter_sanitized_blocks(blocks: list) -> Iterator[tuple[dict | None, str | None]]:
+    """Sanitize StreamField blocks one at a time.
+
+    Yields a ``(block, None)`` pair for each block that passes and a
+    ``(None, error)`` pair for each one that does not, so a caller that only
+    cares about the first error can stop without sanitizing the rest.
 
     Args:
         blocks: List of StreamField block dicts
 
-    Returns:
-        Tuple of (sanitized_blocks, error_messages)
+    Yields:
+        Tuple of (sanitized_block, error_message)
     """
     if not isinstance(blocks, list):
-        return [], ["Invalid block format"]
-
-    sanitized = []
-    errors = []
+        yield None, "Invalid block format"
+        return
 
     for i, block in enumerate(blocks):
         if not isinstance(block, dict):
-            errors.append(f"Block {i} is not a dictionary")
+            yield None, f"Block {i} is not a dictionary"
             continue
 
         block_type = block.get("type")
-        value = block.get("value")
-
-        if block_type == "rich_text":
-            if not isinstance(value, str):
-                errors.append(f"Block {i} rich_text value must be string")
-                continue
-
-            sanitized_html = sanitize_html(value)
-            sanitized.append(
-                {
-                    "type": "rich_text",
-                    "value": sanitized_html,
-                },
-            )
-
-        elif block_type == "code":
-            if not isinstance(value, dict):
-                errors.append(f"Block {i} code value must be dict")
-                continue
-
-            content = value.get("content") or value.get("code", "")
-            language = value.get("language", "")
-
-            # Validate content is string and not too long
-            if not isinstance(content, str):
-                errors.append(f"Block {i} code content must be string")
-                continue
-
-            if len(content) > 10000:  # Max code block size
-                errors.append(f"Block {i} code content exceeds 10000 characters")
-                continue
-
-            sanitized.append(
-                {
-                    "type": "code",
-                    "value": {
-                        "code": content,
-                        "content": content,
-                        "language": language if isinstance(language, str) else "",
-                    },
-                },
-            )
+        # A JSON payload can put a list or object here, which is unhashable
+        sanitize = (
+            _BLOCK_SANITIZERS.get(block_type) if isinstance(block_type, str) else None
+        )
+        if sanitize is None:
+            yield None, f"Block {i} has unknown type: {block_type}"
+            continue
+
+        yield sanitize(i, block.get("value"))
 
-        else:
-            errors.append(f"Block {i} has unknown type: {block_type}")
 
+def sanitize_streamfield_blocks(blocks: list) -> tuple[list, list]:
+    """Sanitize StreamField blocks for XSS attacks.
+
+    Args:
+        blocks: List of StreamField block dicts
+
+    Returns:
+        Tuple of (sanitized_blocks, error_messages)
+    """
+    sanitized = []
+    errors = []
+    for block, error in iter_sanitized_blocks(blocks):
+        if error is None:
+            sanitized.append(block)
+        else:
+            errors.append(error)
     return sanitized, errors
@@ -6,7 +6,7 @@ from django_recaptcha.fields import ReCaptchaField
 from django_recaptcha.widgets import ReCaptchaV3
 
 from config.ratelimit import is_rate_limited
-from config.validation import sanitize_streamfield_blocks
+from config.validation import iter_sanitized_blocks
 from config.validation import validate_comment_length
 
 from .models import Comment
@@ -46,6 +46,16 @@ class CommentForm(forms.ModelForm):
             "text": "Your Comment",
         }
 
+    def _sanitize_blocks(self, blocks):
+        """Sanitize submitted blocks, raising on the first invalid one."""
+        sanitized = []
+        for block, error in iter_sanitized_blocks(blocks):
+            if error is not None:
+                error_msg = f"Invalid comment format: {error}"
+                raise forms.ValidationError(error_msg)
+            sanitized.append(block)
+        return sanitized
+
     def clean_text(self):
         """Convert plain text input to StreamField JSON format and validate."""
         # Check rate limiting before validating content
@@ -79,11 +89,7 @@ class CommentForm(forms.ModelForm):
                 if not parsed:
                     empty_msg = "Comment cannot be empty."
                     raise forms.ValidationError(empty_msg)
-                # Sanitize and validate blocks
-                sanitized, errors = sanitize_streamfield_blocks(parsed)
-                if errors:
-                    error_msg = f"Invalid comment format: {errors[0]}"
-                    raise forms.ValidationError(error_msg)
+                sanitized = self._sanitize_blocks(parsed)
                 # Validate total comment length
                 is_valid, error_msg = validate_comment_length(sanitized)
                 if not is_valid:
@@ -0,0 +1,38 @@
+# Generated by Django 5.2.15 on 2026-10-15 23:22
+
+from django.db import migrations, models
+
+
+def backfill_paths(apps, schema_editor):
+    """Fill path and depth for existing comments, one thread level at a time."""
+    Comment = apps.get_model("blog", "Comment")
+    level = list(Comment.objects.filter(parent__isnull=True))
+    while level:
+        prefixes = {comment.pk: f"{comment.path}{comment.pk}/" for comment in level}
+        children = list(Comment.objects.filter(parent_id__in=prefixes))
+        for child in children:
+            child.path = prefixes[child.parent_id]
+            child.depth = child.path.count("/")
+        Comment.objects.bulk_update(children, ["path", "depth"])
+        level = children
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0008_alter_blogpage_body'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='comment',
+            name='depth',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='comment',
+            name='path',
+            field=models.TextField(blank=True, db_index=True, editable=False),
+        ),
+        migrations.RunPython(backfill_paths, migrations.RunPython.noop),
+    ]
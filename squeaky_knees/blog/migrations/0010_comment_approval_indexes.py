@@ -0,0 +1,21 @@
+# Generated by Django 5.2.15 on 2026-10-15 23:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0009_comment_path_depth'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='comment',
+            index=models.Index(fields=['parent', 'approved'], name='cmt_parent_appr_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='comment',
+            index=models.Index(condition=models.Q(('approved', True)), fields=['blog_page', 'created'], name='cmt_bp_appr_idx'),
+        ),
+    ]
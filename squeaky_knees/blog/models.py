@@ -1,7 +1,15 @@
+from collections import defaultdict
+
 from django.conf import settings
 from django.core.paginator import InvalidPage
+from django.core.paginator import Page as PaginatorPage
 from django.core.paginator import Paginator
 from django.db import models
+from django.db.models import F
+from django.db.models import Q
+from django.db.models import Value
+from django.db.models.functions import Concat
+from django.db.models.functions import Substr
 from modelcluster.contrib.taggit import ClusterTaggableManager
 from modelcluster.fields import ParentalKey
 from modelcluster.models import ClusterableModel
@@ -71,11 +79,24 @@ class BlogIndexPage(Page):
         paginator = Paginator(all_blogpages, self.posts_per_page)
         page_number = request.GET.get("page", 1)
 
-        try:
-            page_obj = paginator.page(page_number)
-        except InvalidPage:
-            # If page number is invalid, return first page
-            page_obj = paginator.page(1)
+        page_obj = None
+        if str(page_number) == "1":
+            # Most visits land on the first page. Fetching one row past it
+            # tells whether the blog fits on that page: if so the row count is
+            # the total and no COUNT query is needed. If not, the page is
+            # still built from these rows, and the COUNT runs once below for
+            # is_paginated (the template's page links need it anyway).
+            rows = list(all_blogpages[: self.posts_per_page + 1])
+            if len(rows) <= self.posts_per_page:
+                paginator.count = len(rows)
+            page_obj = PaginatorPage(rows[: self.posts_per_page], 1, paginator)
+
+        if page_obj is None:
+            try:
+                page_obj = paginator.page(page_number)
+            except InvalidPage:
+                # If page number is invalid, return first page
+                page_obj = paginator.page(1)
 
         context["page_obj"] = page_obj
         context["blogpages"] = page_obj.object_list
@@ -147,25 +168,45 @@ class BlogPage(Page):
         from .forms import CommentForm
 
         context = super().get_context(request)
-        # Get approved top-level comments only (parent=None)
-        root_comments = (
-            Comment.objects.filter(
-                blog_page=self,
-                approved=True,
-                parent__isnull=True,
-            )
-            .select_related("author")
-            .order_by("created")
+        # Load every approved comment on the post in one query and assemble
+        # the threads here, so rendering costs the same at any nesting depth.
+        # Replies under an unapproved comment are unreachable and stay hidden.
+        # blog_page is self and threads come from parent_id, so only the
+        # author needs joining.
+        comments = list(
+            Comment.objects.filter(blog_page=self, approved=True).select_related(
+                "author",
+            ),
         )
-        context["comments"] = root_comments
+        children = defaultdict(list)
+        for comment in comments:
+            children[comment.parent_id].append(comment)
+        for comment in comments:
+            comment.thread_replies = children[comment.pk]
+        # Approved top-level comments only (parent=None), oldest first
+        context["comments"] = children[None]
         context["comment_form"] = CommentForm()
         context["recaptcha_site_key"] = settings.RECAPTCHA_PUBLIC_KEY
         return context
 
 
+class CommentManager(models.Manager):
+    """Manager that keeps tree positions correct for bulk inserts."""
+
+    def bulk_create(self, objs, *args, **kwargs):
+        # bulk_create() skips save(), so position each comment under its
+        # (already saved) parent here.
+        objs = list(objs)
+        for comment in objs:
+            comment.set_tree_position()
+        return super().bulk_create(objs, *args, **kwargs)
+
+
 class Comment(ClusterableModel):
     """Comments on blog posts with support for nested replies."""
 
+    PATH_SEPARATOR = "/"
+
     blog_page = ParentalKey(
         BlogPage,
         on_delete=models.CASCADE,
@@ -196,6 +237,14 @@ class Comment(ClusterableModel):
         default=False,
         help_text="Comments must be approved by admin before appearing on the site",
     )
+    # Materialized path of ancestor ids, root first, each followed by a
+    # separator ("" for top-level, "3/17/" for a reply to 17, which replies
+    # to 3). Kept in sync by save() so depth and root need no parent walk.
+    # Unbounded, since replies may nest to any depth.
+    path = models.TextField(blank=True, editable=False, db_index=True)
+    depth = models.PositiveIntegerField(default=0, editable=False)
+
+    objects = CommentManager()
 
     panels = [
         FieldPanel("author"),
@@ -206,37 +255,88 @@ class Comment(ClusterableModel):
 
     class Meta:
         ordering = ["created"]
+        indexes = [
+            # Approved replies of one comment (comment.replies.filter(...)).
+            models.Index(fields=["parent", "approved"], name="cmt_parent_appr_idx"),
+            # Approved comments of a post, in display order.
+            models.Index(
+                fields=["blog_page", "created"],
+                condition=Q(approved=True),
+                name="cmt_bp_appr_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"Comment by {self.author.username} on {self.blog_page.title}"
 
+    def save(self, *args, **kwargs):
+        old_prefix = self.subtree_prefix if self.pk else None
+        self.set_tree_position()
+        super().save(*args, **kwargs)
+        if old_prefix is not None and old_prefix != self.subtree_prefix:
+            self._move_descendants(old_prefix)
+
+    def set_tree_position(self):
+        """Derive path and depth from the parent comment."""
+        if self.parent_id is None:
+            self.path, self.depth = "", 0
+        else:
+            parent = self.parent
+            self.path = f"{parent.path}{parent.pk}{self.PATH_SEPARATOR}"
+            self.depth = parent.depth + 1
+
+    @property
+    def subtree_prefix(self):
+        """Path prefix shared by every descendant of this comment."""
+        return f"{self.path}{self.pk}{self.PATH_SEPARATOR}"
+
+    def _move_descendants(self, old_prefix):
+        """Rewrite descendant paths after this comment moved to a new parent."""
+        old_depth = old_prefix.count(self.PATH_SEPARATOR) - 1
+        Comment.objects.filter(path__startswith=old_prefix).update(
+            path=Concat(
+                Value(self.subtree_prefix),
+                Substr("path", len(old_prefix) + 1),
+            ),
+            depth=F("depth") + (self.depth - old_depth),
+        )
+
     def is_reply(self):
         """Check if this comment is a reply to another comment."""
-        return self.parent is not None
+        return self.parent_id is not None
 
     def get_root_comment(self):
         """Get the root (top-level) comment of this thread."""
-        current = self
-        while current.parent:
-            current = current.parent
-        return current
+        if not self.path:
+            return self
+        root_id = int(self.path.split(self.PATH_SEPARATOR, 1)[0])
+        # Memoized per instance; keyed on the id so a move to another thread
+        # (which rewrites path) fetches the new root.
+        root = getattr(self, "_root_comment", None)
+        if root is None or root.pk != root_id:
+            root = self._root_comment = Comment.objects.get(pk=root_id)
+        return root
 
     def get_depth(self):
         """Get depth of this comment in the reply chain (0 for top-level)."""
-        depth = 0
-        current = self
-        while current.parent:
-            depth += 1
-            current = current.parent
-        return depth
+        return self.depth
 
     def get_all_replies(self, *, approved_only: bool = True):
-        """Get all replies to this comment recursively."""
+        """Get all replies to this comment recursively.
+
+        The whole subtree comes back in one query on the path prefix and is
+        then ordered depth-first. With ``approved_only``, an unapproved reply
+        hides its own replies as well.
+        """
+        children = defaultdict(list)
+        for reply in Comment.objects.filter(path__startswith=self.subtree_prefix):
+            if reply.approved or not approved_only:
+                children[reply.parent_id].append(reply)
+
         replies = []
-        direct_replies = (
-            self.replies.filter(approved=True) if approved_only else self.replies.all()
-        )
-        for reply in direct_replies:
+        stack = list(reversed(children[self.pk]))
+        while stack:
+            reply = stack.pop()
             replies.append(reply)
-            replies.extend(reply.get_all_replies(approved_only=approved_only))
+            stack.extend(reversed(children[reply.pk]))
         return replies
@@ -170,7 +170,7 @@ class TestCommentModel:
 
         context = blog_post.get_context({})
         comments = context["comments"]
-        assert comments.count() == 1
+        assert len(comments) == 1
 
     def test_comment_code_block_storage(self, blog_post, user):
         """Test comments can store code blocks in StreamField."""
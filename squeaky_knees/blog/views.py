@@ -5,6 +5,7 @@ from django.db.models import Q
 from django.shortcuts import get_object_or_404
 from django.shortcuts import redirect
 from django.shortcuts import render
+from django.views.decorators.cache import cache_page
 
 from .email import send_comment_notification
 from .forms import CommentForm
@@ -114,6 +115,9 @@ def moderate_comments(request):
     return render(request, "blog/moderate_comments.html", context)
 
 
+# Short cache: the bare search page is identical for every visitor, and
+# query/tag results are keyed by their full URL so they stay distinct.
+@cache_page(60)
 def search_blog(request):
     """Search blog posts by title, intro, body, or tag."""
     form = BlogSearchForm()
@@ -21,17 +21,21 @@ class ContactForm(forms.Form):
     RATE_LIMIT_MAX_ATTEMPTS = 5
     RATE_LIMIT_WINDOW_SECONDS = 3600
 
+    # Built once and shared by every instance; crispy only reads the layout
+    # while rendering.
+    _LAYOUT = Layout(
+        Field("name"),
+        Field("email"),
+        Field("message"),
+        Field("captcha"),
+    )
+
     def __init__(self, *args, request=None, **kwargs):
         super().__init__(*args, **kwargs)
         self.request = request
         self.helper = FormHelper()
         self.helper.form_tag = False
-        self.helper.layout = Layout(
-            Field("name"),
-            Field("email"),
-            Field("message"),
-            Field("captcha"),
-        )
+        self.helper.layout = self._LAYOUT
 
     def clean(self):
         cleaned_data = super().clean()
@@ -1,8 +1,16 @@
 """Pytest configuration for tests."""
 
+from datetime import date
+
 import pytest
+from django.contrib.auth import BACKEND_SESSION_KEY
+from django.contrib.auth import HASH_SESSION_KEY
+from django.contrib.auth import SESSION_KEY
 from django.contrib.auth import get_user_model
 from django.core.cache import cache
+from django.db import transaction
+from django.test import Client
+from django.test import RequestFactory
 from wagtail.models import Page
 from wagtail.models import Site
 
@@ -46,8 +54,23 @@ def admin_user(db):
 
 
 @pytest.fixture
-def blog_index(db):
-    """Create a blog index page."""
+def logged_in_client(client, user):
+    """Client whose session already carries ``user``'s auth keys.
+
+    Writes the keys straight into the session instead of going through
+    force_login, which also rotates the session key and fires
+    user_logged_in (an UPDATE of last_login).
+    """
+    session = client.session
+    session[SESSION_KEY] = str(user.pk)
+    session[BACKEND_SESSION_KEY] = "django.contrib.auth.backends.ModelBackend"
+    session[HASH_SESSION_KEY] = user.get_session_auth_hash()
+    session.save()
+    return client
+
+
+def _create_blog_index():
+    """Create and publish the blog index under the default site root."""
     site = Site.objects.filter(is_default_site=True).first()
     if not site:
         root = Page.objects.first()
@@ -76,11 +99,8 @@ def blog_index(db):
     return blog_index
 
 
-@pytest.fixture
-def blog_post(db, blog_index, admin_user):
-    """Create a blog post."""
-    from datetime import date
-
+def _create_blog_post(blog_index):
+    """Create and publish a blog post under ``blog_index``."""
     blog_post = BlogPage(
         title="Test Blog Post",
         date=date.today(),
@@ -98,14 +118,124 @@ def blog_post(db, blog_index, admin_user):
     return blog_post
 
 
+@pytest.fixture
+def blog_index(db):
+    """Create a blog index page."""
+    return _create_blog_index()
+
+
+@pytest.fixture
+def blog_post(db, blog_index, admin_user):
+    """Create a blog post."""
+    return _create_blog_post(blog_index)
+
+
+@pytest.fixture
+def add_live_post():
+    """Return a builder that adds a live post without a revision or publish.
+
+    Pages are live as soon as ``add_child`` saves them, which is all the
+    feed and sitemap queries look at; skipping ``save_revision().publish()``
+    saves a revision row and a second page save per post.
+    """
+
+    def add(blog_index, title, slug, post_date=None):
+        post = BlogPage(
+            title=title,
+            date=post_date or date.today(),
+            intro=title,
+            slug=slug,
+        )
+        post.body = [{"type": "rich_text", "value": f"<p>{title}</p>"}]
+        return blog_index.add_child(instance=post)
+
+    return add
+
+
+@pytest.fixture(scope="module")
+def shared_client():
+    """One anonymous test client for a module's read-only requests.
+
+    Named apart from pytest-django's ``client`` so that a test asking for
+    ``client`` still gets a fresh one with no cookies carried over.
+    """
+    return Client()
+
+
+@pytest.fixture(scope="module")
+def shared_get(shared_client, django_db_setup, django_db_blocker):
+    """Return ``get(path)`` for building class- or module-scoped responses.
+
+    Those fixtures run outside any test's database access, so the request is
+    sent with the blocker lifted.
+    """
+
+    def get(path):
+        with django_db_blocker.unblock():
+            return shared_client.get(path)
+
+    return get
+
+
+@pytest.fixture(scope="module")
+def shared_blog_index(django_db_setup, django_db_blocker):
+    """Create one blog index shared by every test in a module.
+
+    For tests that only read the page tree. The index is created inside an
+    atomic block that stays open for the whole module and is rolled back at
+    teardown; each test's own transaction nests inside it as a savepoint, so
+    rows a test creates or deletes are still undone per test. Tests using it
+    still need the django_db marker: pytest-django only creates the test
+    database when some collected test carries it.
+    """
+    with django_db_blocker.unblock():
+        atomic = transaction.atomic()
+        atomic.__enter__()
+        blog_index = _create_blog_index()
+    yield blog_index
+    with django_db_blocker.unblock():
+        transaction.set_rollback(True)
+        atomic.__exit__(None, None, None)
+
+
+@pytest.fixture(scope="module")
+def shared_blog_post(shared_blog_index, django_db_blocker):
+    """Create one blog post, under ``shared_blog_index``, for a whole module.
+
+    Read-only tests only; it is rolled back with the shared index.
+    """
+    with django_db_blocker.unblock():
+        return _create_blog_post(shared_blog_index)
+
+
+@pytest.fixture(autouse=True, scope="session")
+def mail_dns_name():
+    """Pin the hostname Django puts in email Message-IDs.
+
+    Django resolves it with socket.getfqdn() on the first email sent, which
+    can stall for seconds on hosts with slow reverse DNS.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("django.core.mail.message.DNS_NAME", "testserver")
+        yield
+
+
 @pytest.fixture(autouse=True)
 def clear_cache():
-    """Clear Django cache around every test.
+    """Clear Django cache before and after every test.
 
     Autouse because several views are wrapped in cache_page (home, sitemap,
     feed, robots); without clearing, a response cached in one test would be
-    served to later tests with different database fixtures.
+    served to later tests with different database fixtures. The clear after
+    the test matters for class- and module-scoped responses from shared_get:
+    they are built before the next test's own setup clear runs.
     """
     cache.clear()
     yield
     cache.clear()
+
+
+@pytest.fixture(scope="session")
+def rf():
+    """One RequestFactory for the session; it keeps no per-request state."""
+    return RequestFactory()
@@ -0,0 +1,55 @@
+"""Tests for the blog search form.
+
+Kept apart from the view tests so that running this module on its own never
+needs the test database: nothing here is marked ``django_db``.
+"""
+
+from squeaky_knees.blog.search_forms import BlogSearchForm
+
+
+class TestBlogSearchForm:
+    """Test blog search form validation."""
+
+    def test_search_form_valid(self):
+        """Valid search query should pass."""
+        form = BlogSearchForm({"query": "django"})
+        assert form.is_valid()
+
+    def test_search_form_empty(self):
+        """Empty query should fail."""
+        form = BlogSearchForm({"query": ""})
+        assert not form.is_valid()
+        assert (
+            "required" in str(form.errors).lower()
+            or "empty" in str(form.errors).lower()
+        )
+
+    def test_search_form_too_short(self):
+        """Query shorter than 2 chars should fail."""
+        form = BlogSearchForm({"query": "a"})
+        assert not form.is_valid()
+        assert "2 characters" in str(form.errors)
+
+    def test_search_form_too_long(self):
+        """Query longer than 200 chars should fail."""
+        form = BlogSearchForm({"query": "x" * 300})
+        assert not form.is_valid()
+        assert (
+            "characters" in str(form.errors).lower()
+            or "exceed" in str(form.errors).lower()
+        )
+
+    def test_search_form_removes_harmful_chars(self):
+        """Harmful characters should be removed from query."""
+        form = BlogSearchForm({"query": 'test<script>"alert"</script>'})
+        assert form.is_valid()
+        query = form.cleaned_data["query"]
+        assert "<" not in query
+        assert ">" not in query
+        assert "<script>" not in query
+
+    def test_search_form_strips_whitespace(self):
+        """Whitespace should be stripped."""
+        form = BlogSearchForm({"query": "  django  "})
+        assert form.is_valid()
+        assert form.cleaned_data["query"] == "django"
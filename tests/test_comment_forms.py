@@ -5,33 +5,92 @@ These tests verify that comment forms are properly configured with reCAPTCHA v3
 and use FormHelper with form_tag=False to ensure buttons stay inside form elements.
 """
 
+import functools
 import json
+import re
 
 import pytest
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.test import RequestFactory
-from django.test import TestCase
+from django.test import SimpleTestCase
 from django.urls import reverse
 
+from config.ratelimit import get_identifier_for_user_action
 from squeaky_knees.blog.forms import CommentForm
 
 User = get_user_model()
 
+# RequestFactory holds no per-request state, so one instance serves every test.
+_FACTORY = RequestFactory()
 
-class CommentFormConfigurationTest(TestCase):
+
+@functools.cache
+def _add_comment_url(page_id):
+    """Resolve the comment submission URL once per page id."""
+    return reverse("blog:add_comment", kwargs={"page_id": page_id})
+
+
+@functools.cache
+def _form_section_re(url):
+    return re.compile(re.escape(url.encode()) + rb".*?</form>", re.DOTALL)
+
+
+def _form_section(content, url):
+    """Return the markup from ``url`` up to the closing tag of its form."""
+    match = _form_section_re(url).search(content)
+    return match.group(0) if match else b""
+
+
+# Markers the comment templates are checked for, matched in a single pass.
+# All are ASCII, so they are matched against the raw response bytes.
+_MARKERS_RE = re.compile(
+    b"|".join(
+        map(
+            re.escape,
+            (
+                b"comments-section",
+                b"Comments",
+                b"csrfmiddlewaretoken",
+                b"g-recaptcha",
+                b"Submit Comment",
+                b"Log in",
+            ),
+        ),
+    ),
+)
+
+
+def _present(content):
+    """Return the set of template markers found in ``content``."""
+    return set(_MARKERS_RE.findall(content))
+
+
+# StreamField JSON payloads as the lightweight comment editor submits them.
+TEXT_DATA_SINGLE = json.dumps(
+    [{"type": "rich_text", "value": "<p>This is a valid comment</p>"}],
+)
+TEXT_DATA_MULTI = json.dumps(
+    [
+        {"type": "rich_text", "value": "<p>First paragraph</p>"},
+        {"type": "rich_text", "value": "<p>Second paragraph</p>"},
+    ],
+)
+
+
+class CommentFormConfigurationTest(SimpleTestCase):
     """Test that CommentForm has FormHelper configured correctly."""
 
     def test_comment_form_has_form_helper(self):
         """Test that CommentForm has FormHelper configured."""
-        factory = RequestFactory()
-        request = factory.get("/")
-        request.user = User.objects.create_user(username="testuser", password="test")
+        request = _FACTORY.get("/")
+        request.user = User(id=1, username="testuser")
 
         form = CommentForm(request=request)
 
         # Should have helper attribute
-        self.assertTrue(
-            hasattr(form, "helper"),
+        self.assertIsNotNone(
+            getattr(form, "helper", None),
             "CommentForm missing FormHelper",
         )
 
@@ -41,31 +100,35 @@ class CommentFormConfigurationTest(TestCase):
             "CommentForm.helper.form_tag should be False",
         )
 
+
+class CommentFormConfigStaticTest(SimpleTestCase):
+    """Test CommentForm class-level configuration without building a request."""
+
     def test_comment_form_has_recaptcha_field(self):
         """Test that CommentForm has reCAPTCHA field."""
         from django_recaptcha.fields import ReCaptchaField
 
-        form = CommentForm()
-
         # Should have captcha field
-        self.assertIn("captcha", form.fields)
+        self.assertIn("captcha", CommentForm.base_fields)
 
         # Should be ReCaptchaV3
-        self.assertIsInstance(form.fields["captcha"], ReCaptchaField)
+        self.assertIsInstance(CommentForm.base_fields["captcha"], ReCaptchaField)
 
     def test_comment_form_has_rate_limit_constants(self):
         """Test that CommentForm has rate limit configuration."""
-        # Should have rate limit constants
+        # 10 attempts per 3600 seconds (1 hour)
         self.assertEqual(CommentForm.RATE_LIMIT_MAX_ATTEMPTS, 10)
         self.assertEqual(CommentForm.RATE_LIMIT_WINDOW_SECONDS, 3600)
 
 
-class CommentFormValidationTest(TestCase):
+class CommentFormValidationTest(SimpleTestCase):
     """Test CommentForm validation logic."""
 
-    def setUp(self):
-        self.factory = RequestFactory()
-        self.user = User.objects.create_user(username="commenter", password="test")
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # Unsaved user: form init and rate-limit keys only need an id.
+        cls.user = User(id=1, username="commenter")
 
     def test_comment_form_requires_request(self):
         """Test that CommentForm requires request for rate limiting."""
@@ -75,32 +138,27 @@ class CommentFormValidationTest(TestCase):
 
     def test_comment_form_validates_text_input(self):
         """Test that CommentForm validates comment text."""
-        request = self.factory.post("/")
+        request = _FACTORY.post("/")
         request.user = self.user
         request.META["REMOTE_ADDR"] = "127.0.0.1"
 
-        # Create valid JSON StreamField blocks
-        blocks = [
-            {
-                "type": "rich_text",
-                "value": "<p>This is a valid comment</p>",
-            },
-        ]
-        text_data = json.dumps(blocks)
-
         form_data = {
-            "text": text_data,
+            "text": TEXT_DATA_SINGLE,
             "g-recaptcha-response": "test-token",
         }
 
         form = CommentForm(data=form_data, request=request)
-        # Don't check is_valid() because recaptcha will fail in test,
-        # but we can check the form initializes properly
-        self.assertIsNotNone(form)
+        # reCAPTCHA is stubbed by the autouse mock_recaptcha fixture, so the
+        # form can actually validate without calling Google.
+        self.assertTrue(form.is_valid(), form.errors)
+        self.assertEqual(
+            form.cleaned_data["text"],
+            [{"type": "rich_text", "value": "<p>This is a valid comment</p>"}],
+        )
 
     def test_comment_form_rejects_empty_text(self):
         """Test that CommentForm rejects empty comments."""
-        request = self.factory.post("/")
+        request = _FACTORY.post("/")
         request.user = self.user
         request.META["REMOTE_ADDR"] = "127.0.0.1"
 
@@ -110,24 +168,16 @@ class CommentFormValidationTest(TestCase):
         }
 
         form = CommentForm(data=form_data, request=request)
-        # Form should be invalid due to empty text
-        # (Won't be valid anyway due to recaptcha, but text validation comes first)
-        self.assertIsNotNone(form.errors)
+        self.assertFalse(form.is_valid())
+        self.assertIn("text", form.errors)
 
     def test_comment_form_with_json_input(self):
         """Test that CommentForm accepts JSON StreamField input."""
-        request = self.factory.post("/")
+        request = _FACTORY.post("/")
         request.user = self.user
         request.META["REMOTE_ADDR"] = "127.0.0.1"
 
-        # Valid JSON with multiple blocks
-        blocks = [
-            {"type": "rich_text", "value": "<p>First paragraph</p>"},
-            {"type": "rich_text", "value": "<p>Second paragraph</p>"},
-        ]
-        text_data = json.dumps(blocks)
-
-        form = CommentForm(data={"text": text_data}, request=request)
+        form = CommentForm(data={"text": TEXT_DATA_MULTI}, request=request)
         self.assertIsNotNone(form)
         # Check that text field is properly set
         self.assertIn("text", form.fields)
@@ -137,78 +187,63 @@ class CommentFormValidationTest(TestCase):
 class TestBlogCommentTemplateStructure:
     """Test that comment form in blog template has correct structure."""
 
-    def test_blog_page_renders(self, blog_post, client):
+    def test_blog_page_renders(self, shared_blog_post, client):
         """Test that blog page with comment form loads."""
-        response = client.get(blog_post.url)
+        response = client.get(shared_blog_post.url)
         assert response.status_code == 200
         assert b"Test Blog Post" in response.content
 
-    def test_comment_form_section_exists(self, blog_post, client):
-        """Test that comments section exists in blog page."""
-        response = client.get(blog_post.url)
-        content = response.content.decode()
-        assert "comments-section" in content
-        assert "Comments" in content
-
-    def test_comment_form_button_inside_form(self, blog_post, user, client):
-        """Test that comment submit button is inside form element."""
-        client.force_login(user)
-        response = client.get(blog_post.url)
-        content = response.content.decode()
-        # The form action resolves to /blog/actions/comment/<id>/
-        comment_url = reverse("blog:add_comment", kwargs={"page_id": blog_post.id})
-        form_start = content.find(comment_url)
-        assert form_start != -1
-        form_end = content.find("</form>", form_start)
-        form_section = content[form_start:form_end]
-        assert "Submit Comment" in form_section
-
-    def test_comment_form_captcha_included(self, blog_post, user, client):
-        """Test that reCAPTCHA widget is rendered in comment form."""
-        client.force_login(user)
-        response = client.get(blog_post.url)
-        content = response.content.decode()
-        assert "g-recaptcha" in content or "recaptcha" in content.lower()
-
-    def test_comment_form_csrf_token(self, blog_post, user, client):
-        """Test that CSRF token is present in comment form."""
-        client.force_login(user)
-        response = client.get(blog_post.url)
-        content = response.content.decode()
-        assert "csrfmiddlewaretoken" in content
-
-    def test_anonymous_user_sees_login_prompt(self, blog_post, client):
+    def test_comment_form_markup(self, shared_blog_post, logged_in_client):
+        """Test the logged-in comment form markup from a single render."""
+        response = logged_in_client.get(shared_blog_post.url)
+        present = _present(response.content)
+        for needle in (
+            b"comments-section",
+            b"Comments",
+            b"csrfmiddlewaretoken",
+            b"g-recaptcha",
+        ):
+            assert needle in present, needle
+
+        # The submit button must sit inside the form posting to
+        # /blog/actions/comment/<id>/.
+        url = _add_comment_url(shared_blog_post.id)
+        form_section = _form_section(response.content, url)
+        assert b"Submit Comment" in form_section
+
+    def test_anonymous_user_sees_login_prompt(self, shared_blog_post, client):
         """Test that anonymous users see login prompt instead of comment form."""
-        response = client.get(blog_post.url)
-        content = response.content.decode()
-        assert "Log in" in content
-        assert "Submit Comment" not in content
+        response = client.get(shared_blog_post.url)
+        present = _present(response.content)
+        assert b"Log in" in present
+        assert b"Submit Comment" not in present
 
 
 @pytest.mark.django_db
 class TestCommentFormSubmission:
     """Test that comment form submissions work correctly."""
 
-    def test_unauthenticated_user_cannot_comment(self, blog_post, client):
+    def test_unauthenticated_user_cannot_comment(self, shared_blog_post, client):
         """Test that unauthenticated users cannot submit comments."""
-        url = reverse("blog:add_comment", kwargs={"page_id": blog_post.id})
+        url = _add_comment_url(shared_blog_post.id)
         response = client.post(url, {"text": "Test comment"})
         assert response.status_code == 302
         assert "/accounts/login/" in response.url
 
-    def test_authenticated_user_can_access_comment_form(self, blog_post, user, client):
+    def test_authenticated_user_can_access_comment_form(
+        self,
+        shared_blog_post,
+        logged_in_client,
+    ):
         """Test that authenticated users can access comment form."""
-        client.force_login(user)
-        response = client.get(blog_post.url)
-        content = response.content.decode()
-        comment_url = reverse("blog:add_comment", kwargs={"page_id": blog_post.id})
-        assert comment_url in content
-        assert "Submit Comment" in content
+        response = logged_in_client.get(shared_blog_post.url)
+        comment_url = _add_comment_url(shared_blog_post.id)
+        assert comment_url.encode() in response.content
+        assert b"Submit Comment" in response.content
 
     def test_comment_form_request_parameter_passed(self, user):
         """Test that request is properly passed to CommentForm."""
-        factory = RequestFactory()
-        request = factory.post("/")
+        request = _FACTORY.post("/")
         request.user = user
         request.META["REMOTE_ADDR"] = "127.0.0.1"
 
@@ -217,35 +252,25 @@ class TestCommentFormSubmission:
         assert form.request is request
 
 
-class RateLimitingTest(TestCase):
+class RateLimitingTest(SimpleTestCase):
     """Test that rate limiting works for comment forms."""
 
-    def setUp(self):
-        self.factory = RequestFactory()
-        self.user = User.objects.create_user(username="spammer", password="test")
-
-    def test_rate_limit_configuration(self):
-        """Test that rate limit is configured for comments."""
-        # 10 attempts per 3600 seconds (1 hour)
-        self.assertEqual(CommentForm.RATE_LIMIT_MAX_ATTEMPTS, 10)
-        self.assertEqual(CommentForm.RATE_LIMIT_WINDOW_SECONDS, 3600)
-
     def test_rate_limit_check_in_form_validation(self):
-        """Test that rate limiting validation is checked in form."""
-        request = self.factory.post("/")
-        request.user = self.user
+        """A user already at the limit has their next comment rejected."""
+        request = _FACTORY.post("/")
+        request.user = User(id=1, username="spammer")
         request.META["REMOTE_ADDR"] = "127.0.0.1"
+        # Seed the counter at the limit instead of posting ten comments first.
+        cache.set(
+            get_identifier_for_user_action(request, "comment_add"),
+            CommentForm.RATE_LIMIT_MAX_ATTEMPTS,
+            CommentForm.RATE_LIMIT_WINDOW_SECONDS,
+        )
 
-        # Create a form - it should check rate limiting
-        form = CommentForm(request=request)
-
-        # Form should be initialized
-        self.assertIsNotNone(form)
-
-        # Should have method to check rate limit
-        from config.ratelimit import is_rate_limited
+        form = CommentForm(data={"text": "Spam", "captcha": "x"}, request=request)
 
-        self.assertTrue(callable(is_rate_limited))
+        self.assertFalse(form.is_valid())
+        self.assertIn("too frequently", form.errors["text"][0])
 
 
 if __name__ == "__main__":
@@ -1,184 +1,203 @@
 """Tests for blog email notifications."""
 
+from functools import partial
+from typing import NamedTuple
+from unittest.mock import Mock
+
 import pytest
 from django.conf import settings
+from django.contrib.auth import get_user_model
 from django.core import mail
+from django.core.mail import send_mail
 
 from squeaky_knees.blog.email import send_comment_approval_notification
 from squeaky_knees.blog.email import send_comment_notification
 from squeaky_knees.blog.models import Comment
 
+pytestmark = pytest.mark.xdist_group(name="email")
 
-@pytest.mark.django_db
-class TestCommentNotificationEmails:
-    """Tests for comment notification emails."""
+User = get_user_model()
 
-    def test_send_comment_notification_returns_true_on_success(self, blog_post, user):
-        """send_comment_notification should return True when successful."""
-        # Set post owner
-        blog_post.owner = user
-        blog_post.save()
-
-        comment = Comment.objects.create(
-            blog_page=blog_post,
-            author=user,
-            text=[{"type": "rich_text", "value": "<p>Test comment</p>"}],
-        )
 
-        mail.outbox = []  # Clear outbox
-        result = send_comment_notification(comment)
+class Sent(NamedTuple):
+    """Outcome of one notification send."""
 
-        assert result is True
-        assert len(mail.outbox) == 1
+    result: bool
+    message: mail.EmailMessage
+    comment: Comment
 
-    def test_send_comment_notification_returns_false_without_author_email(
-        self,
-        blog_post,
-        user,
-    ):
-        """send_comment_notification should return False if post has no owner."""
-        # Don't set post owner
-        comment = Comment.objects.create(
-            blog_page=blog_post,
-            author=user,
-            text=[{"type": "rich_text", "value": "<p>Test comment</p>"}],
-        )
 
-        mail.outbox = []
-        result = send_comment_notification(comment)
+@pytest.fixture
+def unsaved_user():
+    """Unsaved user; the email helpers only read its username and email."""
+    return User(username="testuser", email="test@example.com")
 
-        assert result is False
-        assert len(mail.outbox) == 0
 
-    def test_send_comment_notification_includes_blog_post_title(
-        self,
-        blog_post,
-        user,
-    ):
-        """Email subject should include blog post title."""
-        blog_post.owner = user
-        blog_post.save()
+@pytest.fixture(scope="class")
+def mail_connection():
+    """One open mail backend connection reused by every send in a class.
 
-        comment = Comment.objects.create(
-            blog_page=blog_post,
-            author=user,
-            text=[{"type": "rich_text", "value": "<p>Test comment</p>"}],
+    The email module's ``send_mail`` is pointed at it for the class, so the
+    helpers are exercised through their normal signature.
+    """
+    connection = mail.get_connection()
+    connection.open()
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(
+            "squeaky_knees.blog.email.send_mail",
+            partial(send_mail, connection=connection),
         )
+        yield connection
+    connection.close()
 
-        mail.outbox = []
-        send_comment_notification(comment)
 
-        assert len(mail.outbox) == 1
-        assert blog_post.title in mail.outbox[0].subject
+@pytest.fixture
+def owned_post(shared_blog_post, unsaved_user):
+    """The module's shared post, owned by ``unsaved_user`` for one test."""
+    shared_blog_post.owner = unsaved_user
+    yield shared_blog_post
+    shared_blog_post.owner = None
 
-    def test_send_comment_notification_email_to_post_owner(self, blog_post, user):
-        """Email should be sent to blog post owner."""
-        blog_post.owner = user
-        blog_post.save()
 
-        comment = Comment.objects.create(
-            blog_page=blog_post,
-            author=user,
-            text=[{"type": "rich_text", "value": "<p>Test comment</p>"}],
-        )
+@pytest.fixture
+def broken_send_mail(monkeypatch):
+    """Make the email module's send_mail fail like an unreachable mail service."""
+    monkeypatch.setattr(
+        "squeaky_knees.blog.email.send_mail",
+        Mock(side_effect=OSError("Email service error")),
+    )
 
-        mail.outbox = []
-        send_comment_notification(comment)
 
-        assert len(mail.outbox) == 1
-        assert user.email in mail.outbox[0].to
+def _comment(blog_page, author, text=None):
+    """Build an unsaved comment; the senders never need it to be in the database."""
+    return Comment(
+        blog_page=blog_page,
+        author=author,
+        text=text or [{"type": "rich_text", "value": "<p>Test comment</p>"}],
+    )
 
-    def test_send_comment_notification_includes_comment_author(self, blog_post, user):
-        """Email body should include comment author name."""
-        blog_post.owner = user
-        blog_post.save()
 
-        comment = Comment.objects.create(
-            blog_page=blog_post,
-            author=user,
-            text=[{"type": "rich_text", "value": "<p>Test comment</p>"}],
-        )
+def _send_once(send, blog_post, django_db_blocker):
+    """Send one notification for a new comment by the post's owner.
 
-        mail.outbox = []
-        send_comment_notification(comment)
+    The owner is set only for the send and cleared again, so later tests
+    still see an unowned shared post.
+    """
+    author = User(username="testuser", email="test@example.com")
+    comment = _comment(blog_post, author)
+    blog_post.owner = author
+    try:
+        # Resolving the post URL reads the Site table.
+        with django_db_blocker.unblock():
+            result = send(comment)
+    finally:
+        blog_post.owner = None
+    return Sent(result, mail.outbox[-1], comment)
 
-        assert len(mail.outbox) == 1
-        email_content = mail.outbox[0].body or mail.outbox[0].alternatives[0][0]
-        assert user.username in email_content
 
-    def test_send_comment_notification_includes_post_url(self, blog_post, user):
-        """Email should include link to blog post."""
-        blog_post.owner = user
-        blog_post.save()
+@pytest.fixture(scope="class")
+def sent_notification(shared_blog_post, django_db_blocker, mail_connection):
+    """One new-comment notification shared by the read-only tests."""
+    return _send_once(send_comment_notification, shared_blog_post, django_db_blocker)
 
-        comment = Comment.objects.create(
-            blog_page=blog_post,
-            author=user,
-            text=[{"type": "rich_text", "value": "<p>Test comment</p>"}],
-        )
 
-        mail.outbox = []
-        send_comment_notification(comment)
+@pytest.fixture(scope="class")
+def sent_approval(shared_blog_post, django_db_blocker, mail_connection):
+    """One approval notification shared by the read-only tests."""
+    return _send_once(
+        send_comment_approval_notification,
+        shared_blog_post,
+        django_db_blocker,
+    )
 
-        assert len(mail.outbox) == 1
-        email_content = mail.outbox[0].body or mail.outbox[0].alternatives[0][0]
-        assert "blog" in email_content.lower()
 
-    def test_send_comment_notification_sends_html_email(self, blog_post, user):
-        """Email should have HTML version."""
-        blog_post.owner = user
-        blog_post.save()
+def _email_content(message):
+    return message.body or message.alternatives[0][0]
 
-        comment = Comment.objects.create(
-            blog_page=blog_post,
-            author=user,
-            text=[{"type": "rich_text", "value": "<p>Test comment</p>"}],
-        )
 
-        mail.outbox = []
-        send_comment_notification(comment)
+@pytest.mark.django_db
+class TestCommentNotificationMessage:
+    """Tests on a single comment notification email."""
+
+    def test_send_comment_notification_returns_true_on_success(
+        self,
+        sent_notification,
+    ):
+        """send_comment_notification should return True when successful."""
+        assert sent_notification.result is True
+
+    def test_send_comment_notification_includes_blog_post_title(
+        self,
+        sent_notification,
+    ):
+        """Email subject should include blog post title."""
+        blog_post = sent_notification.comment.blog_page
+        assert blog_post.title in sent_notification.message.subject
 
-        assert len(mail.outbox) == 1
-        assert mail.outbox[0].alternatives  # Has HTML alternative
+    def test_send_comment_notification_email_to_post_owner(self, sent_notification):
+        """Email should be sent to blog post owner."""
+        owner = sent_notification.comment.author
+        assert owner.email in sent_notification.message.to
 
-    def test_send_comment_notification_handles_exception(self, blog_post, user):
-        """send_comment_notification should return False on email error."""
-        blog_post.owner = user
-        blog_post.save()
+    def test_send_comment_notification_includes_comment_author(
+        self,
+        sent_notification,
+    ):
+        """Email body should include comment author name."""
+        author = sent_notification.comment.author
+        assert author.username in _email_content(sent_notification.message)
+
+    def test_send_comment_notification_includes_post_url(self, sent_notification):
+        """Email should include link to blog post."""
+        assert "blog" in _email_content(sent_notification.message).lower()
+
+    def test_send_comment_notification_sends_html_email(self, sent_notification):
+        """Email should have HTML version."""
+        assert sent_notification.message.alternatives  # Has HTML alternative
 
-        comment = Comment.objects.create(
-            blog_page=blog_post,
-            author=user,
-            text=[{"type": "rich_text", "value": "<p>Test comment</p>"}],
-        )
 
-        # Mock send_mail to raise an exception
-        import squeaky_knees.blog.email as email_module
+@pytest.mark.django_db
+@pytest.mark.usefixtures("mail_connection")
+class TestCommentNotificationEmails:
+    """Tests for comment notification emails."""
 
-        original_send_mail = email_module.send_mail
+    def test_send_comment_notification_returns_false_without_author_email(
+        self,
+        shared_blog_post,
+        unsaved_user,
+        mailoutbox,
+    ):
+        """send_comment_notification should return False if post has no owner."""
+        # Don't set post owner
+        comment = _comment(shared_blog_post, unsaved_user)
 
-        class EmailServiceError(OSError):
-            """Custom exception for email service errors."""
+        result = send_comment_notification(comment)
 
-        def mock_send_mail(*args, **kwargs):
-            error_msg = "Email service error"
-            raise EmailServiceError(error_msg)
+        assert result is False
+        assert len(mailoutbox) == 0
 
-        email_module.send_mail = mock_send_mail
-        try:
-            result = send_comment_notification(comment)
-            assert result is False
-        finally:
-            email_module.send_mail = original_send_mail
+    @pytest.mark.usefixtures("broken_send_mail")
+    def test_send_comment_notification_handles_exception(
+        self,
+        owned_post,
+        unsaved_user,
+    ):
+        """send_comment_notification should return False on email error."""
+        comment = _comment(owned_post, unsaved_user)
 
-    def test_send_comment_notification_with_code_block(self, blog_post, user):
-        """Email should handle comments with code blocks."""
-        blog_post.owner = user
-        blog_post.save()
+        result = send_comment_notification(comment)
+        assert result is False
 
-        comment = Comment.objects.create(
-            blog_page=blog_post,
-            author=user,
+    def test_send_comment_notification_with_code_block(
+        self,
+        owned_post,
+        unsaved_user,
+        mailoutbox,
+    ):
+        """Email should handle comments with code blocks."""
+        comment = _comment(
+            owned_post,
+            unsaved_user,
             text=[
                 {
                     "type": "code",
@@ -187,202 +206,96 @@ class TestCommentNotificationEmails:
             ],
         )
 
-        mail.outbox = []
         result = send_comment_notification(comment)
 
         assert result is True
-        assert len(mail.outbox) == 1
+        assert len(mailoutbox) == 1
 
 
 @pytest.mark.django_db
-class TestCommentApprovalEmails:
-    """Tests for comment approval notification emails."""
+class TestCommentApprovalMessage:
+    """Tests on a single comment approval email."""
 
-    def test_send_comment_approval_notification_returns_true(self, blog_post, user):
+    def test_send_comment_approval_notification_returns_true(self, sent_approval):
         """send_comment_approval_notification should return True on success."""
-        comment = Comment.objects.create(
-            blog_page=blog_post,
-            author=user,
-            text=[{"type": "rich_text", "value": "<p>Test comment</p>"}],
-        )
-
-        mail.outbox = []
-        result = send_comment_approval_notification(comment)
-
-        assert result is True
-        assert len(mail.outbox) == 1
-
-    def test_send_comment_approval_notification_returns_false_without_email(
-        self,
-        blog_post,
-        user,
-    ):
-        """Return False if comment author has no email."""
-        user.email = ""
-        user.save()
-
-        comment = Comment.objects.create(
-            blog_page=blog_post,
-            author=user,
-            text=[{"type": "rich_text", "value": "<p>Comment</p>"}],
-        )
-
-        mail.outbox = []
-        result = send_comment_approval_notification(comment)
-
-        assert result is False
-        assert len(mail.outbox) == 0
+        assert sent_approval.result is True
 
-    def test_send_comment_approval_notification_email_to_author(
-        self,
-        blog_post,
-        user,
-    ):
+    def test_send_comment_approval_notification_email_to_author(self, sent_approval):
         """Email should be sent to comment author."""
-        comment = Comment.objects.create(
-            blog_page=blog_post,
-            author=user,
-            text=[{"type": "rich_text", "value": "<p>Test comment</p>"}],
-        )
-
-        mail.outbox = []
-        send_comment_approval_notification(comment)
-
-        assert len(mail.outbox) == 1
-        assert user.email in mail.outbox[0].to
+        author = sent_approval.comment.author
+        assert author.email in sent_approval.message.to
 
     def test_send_comment_approval_notification_includes_author_name(
         self,
-        blog_post,
-        user,
+        sent_approval,
     ):
         """Email body should include author name."""
-        comment = Comment.objects.create(
-            blog_page=blog_post,
-            author=user,
-            text=[{"type": "rich_text", "value": "<p>Test comment</p>"}],
-        )
-
-        mail.outbox = []
-        send_comment_approval_notification(comment)
-
-        assert len(mail.outbox) == 1
-        email_content = mail.outbox[0].body or mail.outbox[0].alternatives[0][0]
-        assert user.username in email_content
+        author = sent_approval.comment.author
+        assert author.username in _email_content(sent_approval.message)
 
     def test_send_comment_approval_notification_includes_post_title(
         self,
-        blog_post,
-        user,
+        sent_approval,
     ):
         """Email subject should include blog post title."""
-        comment = Comment.objects.create(
-            blog_page=blog_post,
-            author=user,
-            text=[{"type": "rich_text", "value": "<p>Test comment</p>"}],
-        )
-
-        mail.outbox = []
-        send_comment_approval_notification(comment)
-
-        assert len(mail.outbox) == 1
-        assert blog_post.title in mail.outbox[0].subject
+        blog_post = sent_approval.comment.blog_page
+        assert blog_post.title in sent_approval.message.subject
 
     def test_send_comment_approval_notification_subject_mentions_approval(
         self,
-        blog_post,
-        user,
+        sent_approval,
     ):
         """Email subject should mention approval."""
-        comment = Comment.objects.create(
-            blog_page=blog_post,
-            author=user,
-            text=[{"type": "rich_text", "value": "<p>Test comment</p>"}],
-        )
-
-        mail.outbox = []
-        send_comment_approval_notification(comment)
+        assert "approved" in sent_approval.message.subject.lower()
 
-        assert len(mail.outbox) == 1
-        assert "approved" in mail.outbox[0].subject.lower()
-
-    def test_send_comment_approval_notification_is_html(self, blog_post, user):
+    def test_send_comment_approval_notification_is_html(self, sent_approval):
         """Email should have HTML version."""
-        comment = Comment.objects.create(
-            blog_page=blog_post,
-            author=user,
-            text=[{"type": "rich_text", "value": "<p>Test comment</p>"}],
-        )
-
-        mail.outbox = []
-        send_comment_approval_notification(comment)
-
-        assert len(mail.outbox) == 1
-        assert mail.outbox[0].alternatives
+        assert sent_approval.message.alternatives
 
     def test_send_comment_approval_notification_includes_post_url(
         self,
-        blog_post,
-        user,
+        sent_approval,
     ):
         """Email should include link to the blog post."""
-        comment = Comment.objects.create(
-            blog_page=blog_post,
-            author=user,
-            text=[{"type": "rich_text", "value": "<p>Test comment</p>"}],
-        )
-
-        mail.outbox = []
-        send_comment_approval_notification(comment)
+        assert "blog" in _email_content(sent_approval.message).lower()
 
-        assert len(mail.outbox) == 1
-        email_content = mail.outbox[0].body or mail.outbox[0].alternatives[0][0]
-        assert "blog" in email_content.lower()
-
-    def test_send_comment_approval_notification_handles_exception(
+    def test_send_comment_approval_notification_from_default_email(
         self,
-        blog_post,
-        user,
+        sent_approval,
     ):
-        """send_comment_approval_notification should return False on error."""
-        comment = Comment.objects.create(
-            blog_page=blog_post,
-            author=user,
-            text=[{"type": "rich_text", "value": "<p>Test comment</p>"}],
-        )
+        """Email should be from DEFAULT_FROM_EMAIL."""
+        assert sent_approval.message.from_email == settings.DEFAULT_FROM_EMAIL
 
-        import squeaky_knees.blog.email as email_module
 
-        original_send_mail = email_module.send_mail
+@pytest.mark.django_db
+@pytest.mark.usefixtures("mail_connection")
+class TestCommentApprovalEmails:
+    """Tests for comment approval notification emails."""
+
+    def test_send_comment_approval_notification_returns_false_without_email(
+        self,
+        shared_blog_post,
+        unsaved_user,
+        mailoutbox,
+    ):
+        """Return False if comment author has no email."""
+        unsaved_user.email = ""
 
-        class EmailServiceError(OSError):
-            """Custom exception for email service errors."""
+        comment = _comment(shared_blog_post, unsaved_user)
 
-        def mock_send_mail(*args, **kwargs):
-            error_msg = "Email service error"
-            raise EmailServiceError(error_msg)
+        result = send_comment_approval_notification(comment)
 
-        email_module.send_mail = mock_send_mail
-        try:
-            result = send_comment_approval_notification(comment)
-            assert result is False
-        finally:
-            email_module.send_mail = original_send_mail
+        assert result is False
+        assert len(mailoutbox) == 0
 
-    def test_send_comment_approval_notification_from_default_email(
+    @pytest.mark.usefixtures("broken_send_mail")
+    def test_send_comment_approval_notification_handles_exception(
         self,
-        blog_post,
-        user,
+        shared_blog_post,
+        unsaved_user,
     ):
-        """Email should be from DEFAULT_FROM_EMAIL."""
-        comment = Comment.objects.create(
-            blog_page=blog_post,
-            author=user,
-            text=[{"type": "rich_text", "value": "<p>Test comment</p>"}],
-        )
-
-        mail.outbox = []
-        send_comment_approval_notification(comment)
+        """send_comment_approval_notification should return False on error."""
+        comment = _comment(shared_blog_post, unsaved_user)
 
-        assert len(mail.outbox) == 1
-        assert mail.outbox[0].from_email == settings.DEFAULT_FROM_EMAIL
+        result = send_comment_approval_notification(comment)
+        assert result is False
@@ -1,27 +1,49 @@
 """Tests for custom error pages."""
 
 import pytest
+from django.conf import settings
+from django.urls import get_resolver
+
+pytestmark = pytest.mark.xdist_group(name="errors")
+
+TEMPLATES_DIR = settings.APPS_DIR / "templates"
+
+
+@pytest.fixture(scope="class")
+def not_found_response(shared_get):
+    """The 404 page, rendered once for every test in the class."""
+    return shared_get("/nonexistent-page-12345/")
+
+
+@pytest.fixture(scope="class")
+def content(not_found_response):
+    """The 404 page body, decoded once."""
+    return not_found_response.content.decode()
 
 
 @pytest.mark.django_db
 class TestErrorPages:
     """Tests for custom error page templates."""
 
-    def test_404_page_exists(self, client):
-        """404.html template should exist."""
-        response = client.get("/nonexistent-page-12345/")
-        assert response.status_code == 404
-
-    def test_404_page_renders(self, client):
+    @pytest.mark.parametrize(
+        "path",
+        [
+            "/definitely-does-not-exist/",
+            "/this-page-does-not-exist-xyz/",
+            "/blog/no-such-post/",
+        ],
+    )
+    def test_missing_paths_return_404(self, client, path):
+        """Unknown top-level pages and blog slugs all get a 404."""
+        assert client.get(path).status_code == 404
+
+    def test_404_page_renders(self, not_found_response):
         """404 page should render without error."""
-        response = client.get("/nonexistent-page-12345/")
-        assert response.status_code == 404
-        assert len(response.content) > 0
+        assert not_found_response.status_code == 404
+        assert len(not_found_response.content) > 0
 
-    def test_404_page_includes_message(self, client):
+    def test_404_page_includes_message(self, content):
         """404 page should include helpful message."""
-        response = client.get("/nonexistent-page-12345/")
-        content = response.content.decode()
         # Should mention not found or 404
         assert (
             "not found" in content.lower()
@@ -29,81 +51,41 @@ class TestErrorPages:
             or "page" in content.lower()
         )
 
-    def test_404_page_not_django_default(self, client):
+    def test_404_page_not_django_default(self, content):
         """404 page should not be Django's default error page."""
-        response = client.get("/nonexistent-page-12345/")
-        content = response.content.decode()
         # Should not have default Django error styling
         assert "Django" not in content or "not found" in content.lower()
 
-    def test_500_error_handler_exists(self):
-        """500 error handler should be configured."""
-        # Check that error handlers are in urls.py
-        import config.urls
-
-        # Should have error handler configuration
-        assert hasattr(config, "urls")
+    @pytest.mark.parametrize("status_code", [400, 403, 404, 500])
+    def test_error_handler_exists(self, status_code):
+        """config.urls should resolve a callable handler for each error status."""
+        resolver = get_resolver("config.urls")
+        assert callable(resolver.resolve_error_handler(status_code))
 
-    def test_404_contains_home_link(self, client):
+    def test_404_contains_home_link(self, content):
         """404 page should contain link back to home."""
-        response = client.get("/nonexistent-page-12345/")
-        content = response.content.decode()
         # Should have some navigation or home link
         assert "href" in content or "<a" in content or "/" in content
 
-    def test_404_has_proper_title(self, client):
+    def test_404_has_proper_title(self, content):
         """404 page should have proper title."""
-        response = client.get("/nonexistent-page-12345/")
-        content = response.content.decode()
         # Should have title tag
         assert "<title>" in content
         assert "</title>" in content
 
-    def test_404_status_code_correct(self, client):
-        """404 page should return 404 status code."""
-        response = client.get("/definitely-does-not-exist/")
-        assert response.status_code == 404
-
-    def test_csrf_error_page_exists(self, client):
-        """CSRF error page should be configured."""
-        # This tests that 403_csrf.html is used
-        # We can't easily trigger this in tests but should verify template exists
-        from django.template.exceptions import TemplateDoesNotExist
-        from django.template.loader import get_template
-
-        try:
-            template = get_template("403_csrf.html")
-            assert template is not None
-        except TemplateDoesNotExist:
-            # Template might not be loadable in test environment
-            pass
-
-    def test_permission_denied_page_exists(self, client):
-        """Permission denied (403) page should exist."""
-        from django.template.exceptions import TemplateDoesNotExist
-        from django.template.loader import get_template
-
-        try:
-            template = get_template("403.html")
-            assert template is not None
-        except TemplateDoesNotExist:
-            pass
-
-    def test_error_pages_use_base_template(self, client):
+    @pytest.mark.parametrize("name", ["403.html", "403_csrf.html"])
+    def test_403_templates_exist(self, name):
+        """Permission denied and CSRF failure pages should have templates."""
+        # Neither error can easily be triggered here, so check the files directly
+        assert (TEMPLATES_DIR / name).is_file()
+
+    def test_error_pages_use_base_template(self, content):
         """Error pages should extend base template."""
-        response = client.get("/nonexistent/")
-        content = response.content.decode()
         # Should have HTML structure
         assert "<!DOCTYPE" in content or "<html" in content or "<body" in content
 
-    def test_404_page_accessible(self, client):
-        """404 page should be accessible without raising exceptions."""
-        response = client.get("/this-page-does-not-exist-xyz/")
-        assert response.status_code == 404
-
-    def test_404_page_returns_content(self, client):
+    def test_404_page_returns_content(self, not_found_response):
         """404 page should return response content."""
-        response = client.get("/fake-page/")
-        assert response.status_code == 404
-        assert response.content is not None
-        assert len(response.content) > 0
+        assert not_found_response.status_code == 404
+        assert not_found_response.content is not None
+        assert len(not_found_response.content) > 0
@@ -1,49 +1,49 @@
 """Tests for health check endpoint."""
 
 import pytest
-from django.test import Client
 from django.urls import reverse
 
+pytestmark = pytest.mark.xdist_group(name="health")
+
+
+@pytest.fixture(scope="class")
+def health_response(shared_get):
+    """A single anonymous GET of the health endpoint, shared by the class."""
+    return shared_get(reverse("health"))
+
+
+@pytest.fixture(scope="class")
+def health_data(health_response):
+    """The decoded JSON body of ``health_response``."""
+    return health_response.json()
+
 
 @pytest.mark.django_db
 class TestHealthCheck:
     """Tests for the health check endpoint."""
 
-    def test_health_check_returns_200(self):
+    def test_health_check_returns_200(self, health_response):
         """Health check endpoint should return 200 when healthy."""
-        client = Client()
-        response = client.get(reverse("health"))
-        assert response.status_code == 200
+        assert health_response.status_code == 200
 
-    def test_health_check_returns_json(self):
+    def test_health_check_returns_json(self, health_response):
         """Health check should return JSON response."""
-        client = Client()
-        response = client.get(reverse("health"))
-        assert response["Content-Type"] == "application/json"
-
-    def test_health_check_has_status_ok(self):
-        """Health check should indicate status ok."""
-        client = Client()
-        response = client.get(reverse("health"))
-        data = response.json()
-        assert data["status"] == "ok"
-
-    def test_health_check_has_database_connected(self):
-        """Health check should confirm database is connected."""
-        client = Client()
-        response = client.get(reverse("health"))
-        data = response.json()
-        assert data["database"] == "connected"
-
-    def test_health_check_url_exists(self):
+        assert health_response["Content-Type"] == "application/json"
+
+    @pytest.mark.parametrize(
+        ("key", "expected"),
+        [("status", "ok"), ("database", "connected")],
+    )
+    def test_health_check_reports(self, health_data, key, expected):
+        """Health check should report an ok status and a connected database."""
+        assert health_data[key] == expected
+
+    def test_health_check_url_exists(self, client):
         """Health check endpoint should be accessible at /health/."""
-        client = Client()
-        response = client.get("/health/")
-        assert response.status_code == 200
+        assert reverse("health") == "/health/"
+        assert client.get("/health/").status_code == 200
 
-    def test_health_check_no_authentication_required(self):
+    def test_health_check_no_authentication_required(self, health_response):
         """Health check should not require authentication."""
-        client = Client()
-        response = client.get(reverse("health"))
-        # Not a 403 or 302 redirect
-        assert response.status_code == 200
+        # Fetched by an anonymous client: not a 403 or 302 redirect
+        assert health_response.status_code == 200
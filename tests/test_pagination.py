@@ -1,128 +1,129 @@
 """Tests for blog index pagination."""
 
+from datetime import date
+from datetime import timedelta
+
 import pytest
 from django.test import RequestFactory
 
 from squeaky_knees.blog.models import BlogIndexPage
 
+_RF = RequestFactory()
+
+
+@pytest.fixture(scope="module")
+def base_request():
+    """A plain GET of the index; get_context() only reads from it."""
+    return _RF.get("/")
+
+
+@pytest.fixture
+def full_index(blog_index, add_live_post):
+    """The blog index with one post more than fits on a page, newest first."""
+    today = date.today()
+    posts = [
+        add_live_post(
+            blog_index,
+            f"Post {n}",
+            f"post-{n}",
+            today - timedelta(days=n),
+        )
+        for n in range(blog_index.posts_per_page + 1)
+    ]
+    return blog_index, posts
+
+
+@pytest.fixture
+def unsaved_index():
+    """An index page that was never saved, so it lists no posts."""
+    return BlogIndexPage(title="Blog", slug="blog")
+
 
 @pytest.mark.django_db
 class TestBlogIndexPagination:
     """Test blog index page pagination implementation."""
 
-    def test_blog_index_has_posts_per_page_attribute(self):
+    def test_blog_index_has_posts_per_page_attribute(self, unsaved_index):
         """BlogIndexPage should have posts_per_page attribute."""
-        blog_index = BlogIndexPage(title="Blog", slug="blog")
-        assert hasattr(blog_index, "posts_per_page")
-        assert blog_index.posts_per_page == 10
-
-    def test_blog_index_get_context_has_pagination_keys(self):
+        assert hasattr(unsaved_index, "posts_per_page")
+        assert unsaved_index.posts_per_page == 10
+
+    def test_blog_index_get_context_has_pagination_keys(
+        self,
+        unsaved_index,
+        base_request,
+    ):
         """get_context should always include pagination keys."""
-        blog_index = BlogIndexPage(title="Blog", slug="blog")
-        rf = RequestFactory()
-        request = rf.get("/")
-
-        context = blog_index.get_context(request)
+        context = unsaved_index.get_context(base_request)
 
         assert "page_obj" in context
         assert "paginator" in context
         assert "is_paginated" in context
         assert "blogpages" in context
 
-    def test_blog_index_get_context_with_page_param(self):
-        """get_context should handle page parameter."""
-        blog_index = BlogIndexPage(title="Blog", slug="blog")
-        rf = RequestFactory()
-        request = rf.get("/?page=2")
-
-        context = blog_index.get_context(request)
-
-        # Should not raise an error, even if page doesn't exist
-        assert context["page_obj"] is not None
-
-    def test_blog_index_get_context_with_invalid_page(self):
-        """get_context should handle invalid page numbers gracefully."""
-        blog_index = BlogIndexPage(title="Blog", slug="blog")
-        rf = RequestFactory()
-        request = rf.get("/?page=invalid")
-
-        # Should not raise, should default to page 1
-        context = blog_index.get_context(request)
-        assert context["page_obj"].number == 1
-
-    def test_blog_index_get_context_with_large_page_number(self):
-        """get_context should handle page numbers beyond range."""
-        blog_index = BlogIndexPage(title="Blog", slug="blog")
-        rf = RequestFactory()
-        request = rf.get("/?page=9999")
-
-        # Should not raise, should default to page 1
-        context = blog_index.get_context(request)
-        assert context["page_obj"].number == 1
-
-    def test_blog_index_is_not_paginated_with_no_children(self):
-        """is_paginated should be False with no blog posts."""
-        blog_index = BlogIndexPage(title="Blog", slug="blog")
-        rf = RequestFactory()
-        request = rf.get("/")
-
-        context = blog_index.get_context(request)
-
-        assert context["is_paginated"] is False
-
-    def test_blog_index_paginator_exists(self):
-        """Paginator should be created in context."""
-        blog_index = BlogIndexPage(title="Blog", slug="blog")
-        rf = RequestFactory()
-        request = rf.get("/")
-
-        context = blog_index.get_context(request)
-        paginator = context["paginator"]
-
-        assert paginator is not None
-        assert hasattr(paginator, "count")
-        assert hasattr(paginator, "num_pages")
-        assert hasattr(paginator, "page_range")
-
-    def test_blog_index_paginator_count_zero_when_no_posts(self):
-        """Paginator count should be 0 with no posts."""
-        blog_index = BlogIndexPage(title="Blog", slug="blog")
-        rf = RequestFactory()
-        request = rf.get("/")
-
-        context = blog_index.get_context(request)
+    @pytest.mark.parametrize(
+        "query",
+        [
+            "",  # no page param: first page by default
+            "?page=2",  # page doesn't exist
+            "?page=invalid",  # not a number
+            "?page=9999",  # beyond range
+        ],
+    )
+    def test_blog_index_get_context_falls_back_to_first_page(
+        self,
+        unsaved_index,
+        query,
+    ):
+        """Any page parameter on an empty index should give an unpaginated page 1."""
+        context = unsaved_index.get_context(_RF.get(f"/{query}"))
+        page_obj = context["page_obj"]
         paginator = context["paginator"]
 
+        assert page_obj.number == 1
+        assert context["is_paginated"] is False
+        assert context["blogpages"] == page_obj.object_list
         assert paginator.count == 0
         assert paginator.num_pages == 1
+        assert hasattr(paginator, "page_range")
 
-    def test_blog_index_first_page_by_default(self):
-        """First page should be returned by default."""
-        blog_index = BlogIndexPage(title="Blog", slug="blog")
-        rf = RequestFactory()
-        request = rf.get("/")
-
-        context = blog_index.get_context(request)
-        page_obj = context["page_obj"]
-
-        assert page_obj.number == 1
-
-    def test_blog_index_blogpages_in_context(self):
-        """blogpages should be set to page object list."""
-        blog_index = BlogIndexPage(title="Blog", slug="blog")
-        rf = RequestFactory()
-        request = rf.get("/")
-
-        context = blog_index.get_context(request)
-
-        assert context["blogpages"] == context["page_obj"].object_list
-
-    def test_blog_index_default_page_is_first(self):
-        """When page param is missing, should use page 1."""
-        blog_index = BlogIndexPage(title="Blog", slug="blog")
-        rf = RequestFactory()
-        request = rf.get("/")
-
-        context = blog_index.get_context(request)
-
-        assert context["page_obj"].number == 1
+    def test_blog_index_first_page_skips_count_query(
+        self,
+        blog_index,
+        blog_post,
+        django_assert_num_queries,
+    ):
+        """A blog that fits on one page should be listed without a COUNT."""
+        request = _RF.get("/")
+
+        # .public() looks up view restrictions; the posts take the other query
+        with django_assert_num_queries(2):
+            context = blog_index.get_context(request)
+            assert context["paginator"].count == 1
+            assert context["is_paginated"] is False
+            assert list(context["blogpages"]) == [blog_post]
+
+    def test_blog_index_paginates_past_one_page(
+        self,
+        full_index,
+        django_assert_num_queries,
+    ):
+        """A full first page reuses its rows and only adds the COUNT."""
+        blog_index, posts = full_index
+
+        # view restrictions, the page's rows, then COUNT for num_pages
+        with django_assert_num_queries(3):
+            context = blog_index.get_context(_RF.get("/"))
+            assert context["is_paginated"] is True
+            assert list(context["blogpages"]) == posts[: blog_index.posts_per_page]
+        assert context["paginator"].count == len(posts)
+        assert context["page_obj"].has_next()
+
+    def test_blog_index_second_page(self, full_index):
+        """The post that overflows the first page is listed on the second."""
+        blog_index, posts = full_index
+
+        context = blog_index.get_context(_RF.get("/?page=2"))
+
+        assert context["page_obj"].number == 2
+        assert list(context["blogpages"]) == posts[blog_index.posts_per_page :]
@@ -1,9 +1,12 @@
 """Tests for endpoint rate limiting."""
 
 import pytest
+from django.core.cache import cache
 from django.urls import reverse
 
+from config.ratelimit import get_identifier_for_user_action
 from config.ratelimit import is_rate_limited
+from squeaky_knees.blog.models import Comment
 
 
 @pytest.mark.django_db
@@ -12,27 +15,22 @@ class TestSearchRateLimiting:
 
     def test_search_allows_multiple_queries_within_limit(self, client):
         """Search should allow multiple queries within rate limit."""
+        url = reverse("blog:search")
         for i in range(5):
-            response = client.get(reverse("blog:search"), {"query": f"test{i}"})
+            response = client.get(url, {"query": f"test{i}"})
             assert response.status_code == 200
 
-    def test_search_blocks_excessive_queries(self, rf, clear_cache):
+    def test_search_blocks_excessive_queries(self, rf):
         """Search should block after exceeding rate limit."""
-        from django.test import RequestFactory
-
-        rf = RequestFactory()
-
-        # Simulate exceeding rate limit (30 attempts per 300 seconds)
-        for i in range(31):
-            request = rf.get(f"/blog/actions/search/?query=test{i}")
-            request.META["REMOTE_ADDR"] = "192.168.1.1"
-            request.user = None
-            is_rate_limited(request, "blog_search", max_attempts=30, window_seconds=300)
-
-        # Next request should be rate limited
         request = rf.get("/blog/actions/search/?query=final")
         request.META["REMOTE_ADDR"] = "192.168.1.1"
         request.user = None
+
+        # Seed the counter as if the 30 allowed searches (per 300 seconds)
+        # had already been made from this IP.
+        key = get_identifier_for_user_action(request, "blog_search")
+        cache.set(key, 30, 300)
+
         result = is_rate_limited(
             request,
             "blog_search",
@@ -46,37 +44,39 @@ class TestSearchRateLimiting:
 class TestCommentRateLimiting:
     """Test rate limiting on comment submission."""
 
-    def test_comment_rate_limit_enforced(self, blog_post, user, client, clear_cache):
+    def test_comment_rate_limit_enforced(self, rf, blog_post, user, client):
         """Comments should be rate limited."""
+        # Stand in for the 10 comments allowed per hour: the rows themselves
+        # plus the counter those posts would have left behind.
+        Comment.objects.bulk_create(
+            Comment(
+                blog_page=blog_post,
+                author=user,
+                text=[{"type": "rich_text", "value": f"<p>comment {i}</p>"}],
+            )
+            for i in range(10)
+        )
+        request = rf.post("/")
+        request.user = user
+        cache.set(get_identifier_for_user_action(request, "comment_add"), 10, 3600)
+
         client.force_login(user)
         url = reverse("blog:add_comment", kwargs={"page_id": blog_post.id})
+        response = client.post(url, {"text": "comment 11"})
 
-        # Submit comments up to the limit (10 per hour by default)
-        for i in range(10):
-            response = client.post(url, {"text": f"comment {i}"})
-            # Should succeed (or redirect to post)
-            assert response.status_code in [200, 302]
-
-        # The 11th comment should be blocked or rate limited
-        # This depends on how the rate limiter integrates with the form
-        from squeaky_knees.blog.models import Comment
-
-        comment_count = Comment.objects.filter(author=user).count()
-        assert comment_count >= 10  # Should have created at least 10 comments
+        # The 11th comment is refused and nothing new is stored
+        assert response.status_code in [200, 302]
+        assert Comment.objects.filter(author=user).count() == 10
 
 
 @pytest.mark.django_db
 class TestSignupRateLimiting:
     """Test rate limiting on user signup."""
 
-    def test_signup_rate_limit_enforced(self, client, clear_cache):
+    def test_signup_rate_limit_enforced(self, rf):
         """Signup should be rate limited (5 per hour)."""
-        from django.test import RequestFactory
-
         from squeaky_knees.users.forms import UserSignupForm
 
-        rf = RequestFactory()
-
         # Attempt multiple signups from same IP
         for i in range(5):
             request = rf.post(f"/accounts/signup/?email=user{i}@example.com")
@@ -93,4 +93,3 @@ class TestSignupRateLimiting:
         form = UserSignupForm(request=request)
         # The form's clean() method should catch the rate limit
         assert form.is_valid() is False
-        assert form.is_valid() is False
@@ -5,7 +5,9 @@ These tests verify that all forms using reCAPTCHA v3 are configured consistently
 with FormHelper.form_tag=False and have buttons inside form elements.
 """
 
-from django.test import TestCase
+from unittest.mock import Mock
+
+from django.test import SimpleTestCase
 from django_recaptcha.fields import ReCaptchaField
 
 from squeaky_knees.blog.forms import CommentForm
@@ -14,24 +16,24 @@ from squeaky_knees.users.forms import UserSignupForm
 from squeaky_knees.users.forms import UserSocialSignupForm
 
 
-class ReCaptchaFormConsistencyTest(TestCase):
+class ReCaptchaFormConsistencyTest(SimpleTestCase):
     """Test that all reCAPTCHA forms follow the same pattern."""
 
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # The consistency checks only inspect the forms, so build each once.
+        cls.forms = {
+            "UserSignupForm": UserSignupForm(),
+            "UserSocialSignupForm": UserSocialSignupForm(sociallogin=Mock()),
+            "CommentForm": CommentForm(),
+            "ContactForm": ContactForm(),
+        }
+
     def test_all_recaptcha_forms_have_form_helper(self):
         """Test that all forms with reCAPTCHA have FormHelper configured."""
-        from unittest.mock import Mock
-
-        forms_to_test = [
-            ("UserSignupForm", UserSignupForm, {}),
-            ("UserSocialSignupForm", UserSocialSignupForm, {"sociallogin": Mock()}),
-            ("CommentForm", CommentForm, {}),
-            ("ContactForm", ContactForm, {}),
-        ]
-
-        for form_name, form_class, kwargs in forms_to_test:
+        for form_name, form in self.forms.items():
             with self.subTest(form=form_name):
-                form = form_class(**kwargs)
-
                 # Should have helper attribute
                 self.assertTrue(
                     hasattr(form, "helper"),
@@ -46,19 +48,8 @@ class ReCaptchaFormConsistencyTest(TestCase):
 
     def test_all_recaptcha_forms_have_captcha_field(self):
         """Test that all forms have reCAPTCHA field."""
-        from unittest.mock import Mock
-
-        forms_to_test = [
-            ("UserSignupForm", UserSignupForm, {}),
-            ("UserSocialSignupForm", UserSocialSignupForm, {"sociallogin": Mock()}),
-            ("CommentForm", CommentForm, {}),
-            ("ContactForm", ContactForm, {}),
-        ]
-
-        for form_name, form_class, kwargs in forms_to_test:
+        for form_name, form in self.forms.items():
             with self.subTest(form=form_name):
-                form = form_class(**kwargs)
-
                 # Should have captcha field
                 self.assertIn(
                     "captcha",
@@ -75,20 +66,10 @@ class ReCaptchaFormConsistencyTest(TestCase):
 
     def test_all_recaptcha_forms_use_recaptcha_v3(self):
         """Test that all reCAPTCHA forms use v3 widget."""
-        from unittest.mock import Mock
-
         from django_recaptcha.widgets import ReCaptchaV3
 
-        forms_to_test = [
-            ("UserSignupForm", UserSignupForm, {}),
-            ("UserSocialSignupForm", UserSocialSignupForm, {"sociallogin": Mock()}),
-            ("CommentForm", CommentForm, {}),
-            ("ContactForm", ContactForm, {}),
-        ]
-
-        for form_name, form_class, kwargs in forms_to_test:
+        for form_name, form in self.forms.items():
             with self.subTest(form=form_name):
-                form = form_class(**kwargs)
                 captcha_field = form.fields["captcha"]
 
                 # Should use ReCaptchaV3 widget
@@ -154,7 +135,7 @@ class ReCaptchaFormConsistencyTest(TestCase):
         )
 
 
-class ReCaptchaDataActionTest(TestCase):
+class ReCaptchaDataActionTest(SimpleTestCase):
     """Test that reCAPTCHA data-action attributes are set correctly."""
 
     def test_user_signup_has_correct_action(self):
@@ -172,8 +153,6 @@ class ReCaptchaDataActionTest(TestCase):
 
     def test_social_signup_has_correct_action(self):
         """Test that UserSocialSignupForm has correct reCAPTCHA action."""
-        from unittest.mock import Mock
-
         # UserSocialSignupForm requires sociallogin kwarg
         mock_sociallogin = Mock()
         form = UserSocialSignupForm(sociallogin=mock_sociallogin)
@@ -213,7 +192,7 @@ class ReCaptchaDataActionTest(TestCase):
         )
 
 
-class FormHelperLayoutTest(TestCase):
+class FormHelperLayoutTest(SimpleTestCase):
     """Test that FormHelper layout is properly configured."""
 
     def test_user_signup_form_layout(self):
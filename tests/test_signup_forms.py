@@ -9,57 +9,83 @@ submissions.
 
 import re
 
+import pytest
 from django.contrib.auth import get_user_model
 from django.test import Client
-from django.test import TestCase
+from django.urls import NoReverseMatch
 from django.urls import reverse
+from pytest_django.asserts import assertTemplateUsed
 
 User = get_user_model()
 
+pytestmark = pytest.mark.xdist_group(name="signup")
 
-class SignupFormSubmissionTest(TestCase):
-    """Test that signup form buttons send requests correctly."""
+SIGNUP_URL = reverse("account_signup")
+try:
+    SOCIAL_SIGNUP_URL = reverse("socialaccount_signup")
+except NoReverseMatch:
+    SOCIAL_SIGNUP_URL = None
+
+# Compiled once here rather than looked up again by every test.
+POST_FORM_RE = re.compile(
+    r'<form[^>]*method=["\']post["\'][^>]*>(.*?)</form>',
+    re.DOTALL,
+)
+POST_FORM_OPEN_RE = re.compile(r'<form[^>]*method=["\']post["\']')
+RECAPTCHA_SCRIPT_RE = re.compile(r"<script[^>]*>.*grecaptcha.*</script>", re.DOTALL)
+RECAPTCHA_SRC_RE = re.compile(r"src=.*recaptcha.*\.js")
+
+
+@pytest.fixture(scope="module")
+def signup_page(shared_get):
+    """A single anonymous GET of the signup page, shared by the module."""
+    return shared_get(SIGNUP_URL)
+
+
+@pytest.fixture(scope="module")
+def signup_content(signup_page):
+    """The decoded HTML of ``signup_page``."""
+    return signup_page.content.decode()
 
-    def setUp(self):
-        self.client = Client()
-        self.signup_url = reverse("account_signup")
 
-    def test_signup_page_renders(self):
+@pytest.fixture(scope="module")
+def csrf_client():
+    """A client that enforces CSRF checks like a real browser session."""
+    return Client(enforce_csrf_checks=True)
+
+
+@pytest.mark.django_db
+class TestSignupFormSubmission:
+    """Test that signup form buttons send requests correctly."""
+
+    def test_signup_page_renders(self, signup_page):
         """Test that signup page loads successfully."""
-        response = self.client.get(self.signup_url)
-        self.assertEqual(response.status_code, 200)
-        self.assertTemplateUsed(response, "account/signup.html")
+        assert signup_page.status_code == 200
+        assertTemplateUsed(signup_page, "account/signup.html")
 
-    def test_signup_form_has_required_fields(self):
+    def test_signup_form_has_required_fields(self, signup_content):
         """Test that signup form contains expected fields."""
-        response = self.client.get(self.signup_url)
-        content = response.content.decode()
-
         # Should have CSRF token
-        self.assertIn("csrfmiddlewaretoken", content)
+        assert "csrfmiddlewaretoken" in signup_content
 
         # Should have reCAPTCHA widget (looks for class, not name)
-        self.assertIn('class="g-recaptcha"', content)
+        assert 'class="g-recaptcha"' in signup_content
 
         # Should have submit button
-        self.assertIn('type="submit"', content)
+        assert 'type="submit"' in signup_content
 
-    def test_signup_form_media_included(self):
+    def test_signup_form_media_included(self, signup_content):
         """
         Test that form.media is rendered (loads reCAPTCHA JavaScript).
 
         This is critical - without {{ form.media }}, the reCAPTCHA widget
         JavaScript won't load and the form won't validate.
         """
-        response = self.client.get(self.signup_url)
-        content = response.content.decode()
-
         # Should include reCAPTCHA widget JavaScript
-        self.assertIn("recaptcha", content.lower())
+        assert "recaptcha" in signup_content.lower()
         # Should be a <script> tag loading the widget
-        self.assertTrue(
-            re.search(r"<script[^>]*>.*grecaptcha.*</script>", content, re.DOTALL)
-            or re.search(r"src=.*recaptcha.*\.js", content),
+        assert RECAPTCHA_SCRIPT_RE.search(signup_content) or (
+            RECAPTCHA_SRC_RE.search(signup_content)
         )
 
     def test_signup_post_with_valid_data(self):
@@ -72,17 +98,18 @@ class SignupFormSubmissionTest(TestCase):
             "g-recaptcha-response": "test-token",
         }
 
-        response = self.client.post(self.signup_url, data=signup_data)
+        # A client of its own, so signup session state stays out of the
+        # shared one.
+        response = Client().post(SIGNUP_URL, data=signup_data)
 
-        # Should redirect on success (to verification page or confirmation)
-        # Response may be 200 (form re-rendered with errors) or 302 (redirect)
-        self.assertIn(response.status_code, [200, 302])
+        # reCAPTCHA is stubbed by the autouse mock_recaptcha fixture, so a
+        # valid form always goes on to the email verification redirect.
+        assert response.status_code == 302
+        assert response.url == reverse("account_email_verification_sent")
+        assert User.objects.filter(username="testuser123").exists()
 
-    def test_signup_post_without_csrf_token_fails(self):
+    def test_signup_post_without_csrf_token_fails(self, csrf_client):
         """Test that POST without CSRF token is rejected."""
-        # Disable CSRF middleware for this test
-        client = Client(enforce_csrf_checks=True)
-
         signup_data = {
             "username": "testuser",
             "email": "test@example.com",
@@ -90,47 +117,33 @@ class SignupFormSubmissionTest(TestCase):
             "password2": "TestPassword123!",
         }
 
-        response = client.post(self.signup_url, data=signup_data)
+        response = csrf_client.post(SIGNUP_URL, data=signup_data)
 
         # Should reject with 403 Forbidden
-        self.assertEqual(response.status_code, 403)
+        assert response.status_code == 403
 
 
-class SignupTemplateStructureTest(TestCase):
+@pytest.mark.django_db
+class TestSignupTemplateStructure:
     """Test that signup template has correct HTML structure."""
 
-    def setUp(self):
-        self.client = Client()
-        self.signup_url = reverse("account_signup")
-
-    def test_button_is_inside_form_element(self):
+    def test_button_is_inside_form_element(self, signup_content):
         """
         Test that submit button is inside <form> element.
 
         This is the critical fix for the crispy-forms + django-recaptcha issue.
         If the button is outside the form, form submissions won't work.
         """
-        response = self.client.get(self.signup_url)
-        content = response.content.decode()
-
         # Extract the form section
-        form_match = re.search(
-            r'<form[^>]*method=["\']post["\'][^>]*>(.*?)</form>',
-            content,
-            re.DOTALL,
-        )
-        self.assertIsNotNone(form_match, "No form element with POST method found")
+        form_match = POST_FORM_RE.search(signup_content)
+        assert form_match is not None, "No form element with POST method found"
 
         form_content = form_match.group(1)
 
         # Button should be inside form
-        self.assertIn(
-            'type="submit"',
-            form_content,
-            "Submit button not found inside form",
-        )
+        assert 'type="submit"' in form_content, "Submit button not found inside form"
 
-    def test_crispy_form_renders_without_form_tags(self):
+    def test_crispy_form_renders_without_form_tags(self, signup_content):
         """
         Test that crispy form is configured with form_tag=False.
 
@@ -138,121 +151,79 @@ class SignupTemplateStructureTest(TestCase):
         <form>...</form> tags, making the manual form tags unnecessary or
         causing nested forms.
         """
-        response = self.client.get(self.signup_url)
-        content = response.content.decode()
-
         # Should have exactly one opening <form> tag (the manual one)
-        form_opens = len(re.findall(r'<form[^>]*method=["\']post["\']', content))
-        self.assertEqual(
-            form_opens,
-            1,
+        form_opens = len(POST_FORM_OPEN_RE.findall(signup_content))
+        assert form_opens == 1, (
             f"Expected 1 form element, found {form_opens}. "
-            "Check FormHelper.form_tag setting.",
+            "Check FormHelper.form_tag setting."
         )
 
-    def test_csrf_token_inside_form(self):
+    def test_csrf_token_inside_form(self, signup_content):
         """Test that CSRF token is inside form element."""
-        response = self.client.get(self.signup_url)
-        content = response.content.decode()
-
         # Extract form section
-        form_match = re.search(
-            r'<form[^>]*method=["\']post["\'][^>]*>(.*?)</form>',
-            content,
-            re.DOTALL,
-        )
-        self.assertIsNotNone(form_match, "No form element found")
+        form_match = POST_FORM_RE.search(signup_content)
+        assert form_match is not None, "No form element found"
 
         form_content = form_match.group(1)
 
         # CSRF token should be inside form
-        self.assertIn(
-            "csrfmiddlewaretoken",
-            form_content,
-            "CSRF token not found inside form",
-        )
+        assert "csrfmiddlewaretoken" in form_content, "CSRF token not found inside form"
 
-    def test_recaptcha_input_inside_form(self):
+    def test_recaptcha_input_inside_form(self, signup_content):
         """Test that reCAPTCHA response input is inside form element."""
-        response = self.client.get(self.signup_url)
-        content = response.content.decode()
-
         # Extract form section
-        form_match = re.search(
-            r'<form[^>]*method=["\']post["\'][^>]*>(.*?)</form>',
-            content,
-            re.DOTALL,
-        )
-        self.assertIsNotNone(form_match, "No form element found")
+        form_match = POST_FORM_RE.search(signup_content)
+        assert form_match is not None, "No form element found"
 
         form_content = form_match.group(1)
 
         # reCAPTCHA input should be inside form (look for g-recaptcha class)
-        self.assertIn(
-            "g-recaptcha",
-            form_content,
-            "reCAPTCHA input not found inside form",
-        )
+        assert "g-recaptcha" in form_content, "reCAPTCHA input not found inside form"
 
-    def test_form_has_correct_action_and_method(self):
+    def test_form_has_correct_action_and_method(self, signup_content):
         """Test that form has POST method and correct action URL."""
-        response = self.client.get(self.signup_url)
-        content = response.content.decode()
-
         # Form should have method="post"
-        self.assertIn('method="post"', content)
+        assert 'method="post"' in signup_content
 
         # Form should have action attribute pointing to signup URL
-        self.assertTrue(
-            re.search(r'action="/accounts/signup/"', content),
-            "Form action not pointing to signup endpoint",
+        assert 'action="/accounts/signup/"' in signup_content, (
+            "Form action not pointing to signup endpoint"
         )
 
 
-class SocialSignupFormTest(TestCase):
+@pytest.mark.django_db
+@pytest.mark.skipif(
+    SOCIAL_SIGNUP_URL is None,
+    reason="Social signup URL not configured",
+)
+class TestSocialSignupForm:
     """Test that social signup forms have same structure as regular signup."""
 
-    def setUp(self):
-        self.client = Client()
-        # Try to get social signup URL if it exists
-        from django.urls import NoReverseMatch
-
-        try:
-            self.social_signup_url = reverse("socialaccount_signup")
-        except NoReverseMatch:
-            self.social_signup_url = None
-
-    def test_social_signup_button_inside_form(self):
+    def test_social_signup_button_inside_form(self, client):
         """Test that social signup button is also inside form element."""
-        if not self.social_signup_url:
-            self.skipTest("Social signup URL not configured")
-
-        response = self.client.get(self.social_signup_url)
+        response = client.get(SOCIAL_SIGNUP_URL)
 
         # Social signup may redirect, so accept both 200 and 302
-        self.assertIn(response.status_code, [200, 302])
+        assert response.status_code in [200, 302]
 
         content = response.content.decode()
 
         # Extract form section
-        form_match = re.search(
-            r'<form[^>]*method=["\']post["\'][^>]*>(.*?)</form>',
-            content,
-            re.DOTALL,
-        )
+        form_match = POST_FORM_RE.search(content)
 
         if form_match:
             form_content = form_match.group(1)
             # Button should be inside form
-            self.assertIn(
-                'type="submit"',
-                form_content,
-                "Submit button not found inside social signup form",
+            assert 'type="submit"' in form_content, (
+                "Submit button not found inside social signup form"
             )
 
 
-class FormHelperConfigurationTest(TestCase):
-    """Test that FormHelper is correctly configured in form classes."""
+class TestFormHelperConfiguration:
+    """Test that FormHelper is correctly configured in form classes.
+
+    These only build unbound forms, so they need no database.
+    """
 
     def test_user_signup_form_has_form_helper(self):
         """Test that UserSignupForm has FormHelper configured."""
@@ -261,15 +232,11 @@ class FormHelperConfigurationTest(TestCase):
         form = UserSignupForm()
 
         # Should have helper attribute
-        self.assertTrue(
-            hasattr(form, "helper"),
-            "UserSignupForm missing FormHelper",
-        )
+        assert hasattr(form, "helper"), "UserSignupForm missing FormHelper"
 
         # form_tag should be False
-        self.assertFalse(
-            form.helper.form_tag,
-            "UserSignupForm.helper.form_tag should be False",
+        assert not form.helper.form_tag, (
+            "UserSignupForm.helper.form_tag should be False"
         )
 
     def test_user_social_signup_form_has_form_helper(self):
@@ -283,15 +250,11 @@ class FormHelperConfigurationTest(TestCase):
         form = UserSocialSignupForm(sociallogin=mock_sociallogin)
 
         # Should have helper attribute
-        self.assertTrue(
-            hasattr(form, "helper"),
-            "UserSocialSignupForm missing FormHelper",
-        )
+        assert hasattr(form, "helper"), "UserSocialSignupForm missing FormHelper"
 
         # form_tag should be False
-        self.assertFalse(
-            form.helper.form_tag,
-            "UserSocialSignupForm.helper.form_tag should be False",
+        assert not form.helper.form_tag, (
+            "UserSocialSignupForm.helper.form_tag should be False"
         )
 
     def test_signup_form_has_recaptcha_field(self):
@@ -301,15 +264,9 @@ class FormHelperConfigurationTest(TestCase):
         form = UserSignupForm()
 
         # Should have captcha field
-        self.assertIn("captcha", form.fields)
+        assert "captcha" in form.fields
 
         # Should be ReCaptchaV3
         from django_recaptcha.fields import ReCaptchaField
 
-        self.assertIsInstance(form.fields["captcha"], ReCaptchaField)
-
-
-if __name__ == "__main__":
-    import unittest
-
-    unittest.main()
+        assert isinstance(form.fields["captcha"], ReCaptchaField)
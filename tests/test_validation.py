@@ -1,5 +1,9 @@
 """Tests for input validation and sanitization."""
 
+import pytest
+
+from config.validation import MAX_COMMENT_LENGTH
+from config.validation import iter_sanitized_blocks
 from config.validation import sanitize_html
 from config.validation import sanitize_streamfield_blocks
 from config.validation import validate_comment_length
@@ -40,6 +44,14 @@ class TestHtmlSanitization:
         clean = sanitize_html(dirty)
         assert "<style>" not in clean
 
+    def test_sanitize_html_removes_mixed_dangerous_elements(self):
+        """Each dangerous element is removed up to its own end tag."""
+        dirty = (
+            "<SCRIPT>alert(1)</script><p>keep</p>"
+            "<style>p {}</style><iframe src='evil.com'></IFRAME>"
+        )
+        assert sanitize_html(dirty) == "<p>keep</p>"
+
     def test_sanitize_html_preserves_safe_content(self):
         """Safe HTML should be preserved."""
         safe = "<p>Hello <strong>world</strong></p>"
@@ -48,6 +60,23 @@ class TestHtmlSanitization:
         assert "<strong>" in result
         assert "Hello" in result
 
+    @pytest.mark.parametrize(
+        "dirty",
+        [
+            "<ifr<script></script>ame src=javascript:alert(1)></iframe>",
+            '<ifr onx="1"ame src=x></iframe>',
+            "<sty<script>x</script>le>body{}</style>",
+        ],
+    )
+    def test_sanitize_html_removes_tags_reassembled_by_earlier_passes(self, dirty):
+        """A tag split by a script or handler is removed once it is joined up."""
+        assert sanitize_html(dirty) == ""
+
+    def test_sanitize_html_returns_plain_text_unchanged(self):
+        """Text without any markup passes through as-is."""
+        plain = "Knee clicks at onset=30 degrees, see someone about it"
+        assert sanitize_html(plain) is plain
+
     def test_sanitize_html_handles_non_string(self):
         """Non-string input should return empty string."""
         assert sanitize_html(None) == ""
@@ -87,6 +116,13 @@ class TestCommentLengthValidation:
         is_valid, _error = validate_comment_length(blocks)
         assert is_valid is True
 
+    def test_validate_comment_length_tags_do_not_count_toward_max(self):
+        """Exactly the maximum visible text passes however much markup wraps it."""
+        text = "<strong>" + "x" * MAX_COMMENT_LENGTH + "</strong>"
+        blocks = [{"type": "rich_text", "value": f"<p>{text}</p>"}]
+        is_valid, _error = validate_comment_length(blocks)
+        assert is_valid is True
+
     def test_validate_comment_length_code_block(self):
         """Code blocks should be included in length."""
         blocks = [
@@ -286,6 +322,13 @@ class TestStreamFieldSanitization:
         assert len(errors) == 1
         assert "unknown type" in errors[0]
 
+    def test_sanitize_streamfield_blocks_unhashable_type(self):
+        """A list or object as the block type is reported, not raised."""
+        blocks = [{"type": ["rich_text"], "value": "<p>x</p>"}]
+        sanitized, errors = sanitize_streamfield_blocks(blocks)
+        assert sanitized == []
+        assert "unknown type" in errors[0]
+
     def test_sanitize_streamfield_blocks_code_without_language(self):
         """Code block without language should work."""
         blocks = [
@@ -294,3 +337,10 @@ class TestStreamFieldSanitization:
         sanitized, _errors = sanitize_streamfield_blocks(blocks)
         assert len(sanitized) == 1
         assert sanitized[0]["value"]["language"] == ""
+
+    def test_iter_sanitized_blocks_stops_at_first_error(self):
+        """Blocks after the first error are not touched if iteration stops."""
+        blocks = ["not a dict", {"type": "rich_text", "value": None}]
+        results = iter_sanitized_blocks(blocks)
+        assert next(results) == (None, "Block 0 is not a dictionary")
+        results.close()